@@ -31,10 +31,14 @@ setup(
         "dev": [
             "pytest>=8.3.0",
             "pytest-cov>=5.0.0",
+            "pytest-xdist>=3.5.0",
             "black>=24.8.0",
             "ruff>=0.7.0",
             "mypy>=1.11.0",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -2,11 +2,11 @@
 
 Each concrete agent implements a ``run`` method that receives a context dict and
 returns a response conforming to the common response schema defined in
-``response_schema.json``. For now the agents are simple placeholders that return
-an ``OK`` status.
+``response_schema.json``. For now most agents are :class:`PlaceholderAgent`
+subclasses that return an ``OK`` status.
 """
 
-from .base import Agent
+from .base import Agent, PlaceholderAgent
 from .orchestrator_agent import OrchestratorAgent
 from .client_liaison_agent import ClientLiaisonAgent
 from .planner_agent import PlannerAgent
@@ -40,6 +40,7 @@ registry.register("reviewer_fe", ReviewerFEAgent)
 
 __all__ = [
     "Agent",
+    "PlaceholderAgent",
     "OrchestratorAgent",
     "ClientLiaisonAgent",
     "PlannerAgent",
@@ -5,28 +5,10 @@ This agent is responsible for backend development.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from .base import PlaceholderAgent
 
-from .base import Agent
 
+class BackendDevAgent(PlaceholderAgent):
+    """Backend Developer Agent implementation."""
 
-class BackendDevAgent(Agent):
-    """Backend Developer Agent implementation.
-
-    The ``run`` method receives a context (which may be empty for the initial
-    call) and returns a minimal success payload.
-    """
-
-    def run(self, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        # In a full implementation this would develop the backend.
-        # For now, we provide a placeholder response.
-        return {
-            "status": "OK",
-            "summary": "Backend developer agent executed successfully",
-            "findings": [],
-            "artifacts": [],
-            "next_actions": [],
-            "context": context or {},
-            "trace_id": "placeholder-trace-id",
-            "execution_time_ms": 0,
-        }
+    summary = "Backend developer agent executed successfully"
@@ -32,3 +32,32 @@ class Agent:
             A dictionary matching the common response schema.
         """
         raise NotImplementedError("Agent subclasses must implement the run method")
+
+
+# Fields shared by every placeholder response. The empty collections are
+# tuples so the shared template can't be mutated through a returned response;
+# they serialize to JSON arrays like lists do.
+_PLACEHOLDER_RESPONSE: Dict[str, Any] = {
+    "status": "OK",
+    "findings": (),
+    "artifacts": (),
+    "next_actions": (),
+    "trace_id": "placeholder-trace-id",
+    "execution_time_ms": 0,
+}
+
+
+class PlaceholderAgent(Agent):
+    """Agent that returns a fixed success payload.
+
+    Concrete placeholder agents only set :attr:`summary`; the ``run`` method
+    receives a context (which may be empty for the initial call) and returns a
+    minimal success payload.
+    """
+
+    summary = "Agent executed successfully"
+
+    def run(self, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        # In a full implementation subclasses would override this with their
+        # own logic. For now, we provide a placeholder response.
+        return {**_PLACEHOLDER_RESPONSE, "summary": self.summary, "context": context or {}}
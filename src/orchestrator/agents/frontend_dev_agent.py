@@ -5,28 +5,10 @@ This agent is responsible for frontend development.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from .base import PlaceholderAgent
 
-from .base import Agent
 
+class FrontendDevAgent(PlaceholderAgent):
+    """Frontend Developer Agent implementation."""
 
-class FrontendDevAgent(Agent):
-    """Frontend Developer Agent implementation.
-
-    The ``run`` method receives a context (which may be empty for the initial
-    call) and returns a minimal success payload.
-    """
-
-    def run(self, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        # In a full implementation this would develop the frontend.
-        # For now, we provide a placeholder response.
-        return {
-            "status": "OK",
-            "summary": "Frontend developer agent executed successfully",
-            "findings": [],
-            "artifacts": [],
-            "next_actions": [],
-            "context": context or {},
-            "trace_id": "placeholder-trace-id",
-            "execution_time_ms": 0,
-        }
+    summary = "Frontend developer agent executed successfully"
@@ -20,12 +20,16 @@ class AgentLoader:
 
     def __init__(self) -> None:
         self._registry = registry
+        self._cache: Dict[str, Agent] = {}
 
     def load_agent(self, agent_id: str, context: Dict[str, Any] | None = None) -> Agent:
-        """Load and instantiate an agent by its ID.
+        """Load an agent by its ID, instantiating it on first use.
+
+        Agents are stateless between ``run`` calls, so one instance per ID is
+        created and reused for every subsequent request.
 
         Args:
-            agent_id: The ID of the agent to instantiate.
+            agent_id: The ID of the agent to load.
             context: Optional context to pass to the agent.
 
         Returns:
@@ -34,9 +38,20 @@ class AgentLoader:
         Raises:
             KeyError: If the agent ID is not found in the registry.
         """
+        agent = self._cache.get(agent_id)
+        if agent is None:
+            agent = self._cache.setdefault(agent_id, self._load_uncached(agent_id))
+        return agent
+
+    def _load_uncached(self, agent_id: str) -> Agent:
+        """Instantiate a new agent by its ID."""
         agent_class = self._registry.get(agent_id)
         return agent_class(agent_id=agent_id)
 
+    def clear_cache(self) -> None:
+        """Drop cached agent instances, e.g. after re-registering agent classes."""
+        self._cache.clear()
+
     def list_agents(self) -> list[str]:
         """List all available agent IDs.
 
@@ -7,28 +7,10 @@ schema defined in ``response_schema.json``.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from .base import PlaceholderAgent
 
-from .base import Agent
 
+class OrchestratorAgent(PlaceholderAgent):
+    """Orchestrator agent implementation."""
 
-class OrchestratorAgent(Agent):
-    """Orchestrator agent implementation.
-
-    The ``run`` method receives a context (which may be empty for the initial
-    call) and returns a minimal success payload.
-    """
-
-    def run(self, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        # In a full implementation this would coordinate sub‑agents. Here we
-        # provide a placeholder response.
-        return {
-            "status": "OK",
-            "summary": "Orchestrator agent executed successfully",
-            "findings": [],
-            "artifacts": [],
-            "next_actions": [],
-            "context": context or {},
-            "trace_id": "placeholder-trace-id",
-            "execution_time_ms": 0,
-        }
+    summary = "Orchestrator agent executed successfully"
@@ -5,28 +5,10 @@ This agent is responsible for planning the workflow and defining tasks.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from .base import PlaceholderAgent
 
-from .base import Agent
 
+class PlannerAgent(PlaceholderAgent):
+    """Planner Agent implementation."""
 
-class PlannerAgent(Agent):
-    """Planner Agent implementation.
-
-    The ``run`` method receives a context (which may be empty for the initial
-    call) and returns a minimal success payload.
-    """
-
-    def run(self, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        # In a full implementation this would plan the workflow.
-        # For now, we provide a placeholder response.
-        return {
-            "status": "OK",
-            "summary": "Planner agent executed successfully",
-            "findings": [],
-            "artifacts": [],
-            "next_actions": [],
-            "context": context or {},
-            "trace_id": "placeholder-trace-id",
-            "execution_time_ms": 0,
-        }
+    summary = "Planner agent executed successfully"
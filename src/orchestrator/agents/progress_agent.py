@@ -5,28 +5,10 @@ This agent is responsible for tracking progress and managing workflow execution.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from .base import PlaceholderAgent
 
-from .base import Agent
 
+class ProgressAgent(PlaceholderAgent):
+    """Progress Agent implementation."""
 
-class ProgressAgent(Agent):
-    """Progress Agent implementation.
-
-    The ``run`` method receives a context (which may be empty for the initial
-    call) and returns a minimal success payload.
-    """
-
-    def run(self, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        # In a full implementation this would track progress.
-        # For now, we provide a placeholder response.
-        return {
-            "status": "OK",
-            "summary": "Progress agent executed successfully",
-            "findings": [],
-            "artifacts": [],
-            "next_actions": [],
-            "context": context or {},
-            "trace_id": "placeholder-trace-id",
-            "execution_time_ms": 0,
-        }
+    summary = "Progress agent executed successfully"
@@ -6,11 +6,29 @@ This agent is responsible for auditing the quality of the deliverables.
 from __future__ import annotations
 
 import re
+from collections import Counter
 from typing import Any, Dict, List
 
 from .base import Agent
 
 
+# Code audit patterns, compiled once rather than looked up on every audit
+_PY_CREDENTIALS_RE = re.compile(
+    r"(?:password|secret|api_key|token)\s*=\s*['\"][^'\"]+['\"]", re.IGNORECASE
+)
+_JS_CREDENTIALS_RE = re.compile(
+    r"(?:password|secret|apiKey|token)\s*=\s*['\"][^'\"]+['\"]", re.IGNORECASE
+)
+_PRINT_RE = re.compile(r"print\s*\(")
+_EMPTY_EXCEPT_RE = re.compile(r"except:\s*pass")
+_DOCSTRING_RE = re.compile(r'""".*"""|\'\'\'.*\'\'\'', re.DOTALL)
+_DEF_RE = re.compile(r"\s*def\s+\w+")
+_CONSOLE_LOG_RE = re.compile(r"console\.log\s*\(")
+_TRY_BLOCK_RE = re.compile(r"try\s*\{")
+_ASYNC_FUNCTION_RE = re.compile(r"async\s+function")
+_AWAIT_RE = re.compile(r"await\s+\w+")
+
+
 class QualityAuditorAgent(Agent):
     """Quality Auditor Agent implementation.
 
@@ -189,27 +207,18 @@ class QualityAuditorAgent(Agent):
             content = artifact["content"]
             
             # Check for hardcoded credentials
-            credential_patterns = [
-                r"password\s*=\s*['\"][^'\"]+['\"]",
-                r"secret\s*=\s*['\"][^'\"]+['\"]",
-                r"api_key\s*=\s*['\"][^'\"]+['\"]",
-                r"token\s*=\s*['\"][^'\"]+['\"]"
-            ]
-            
-            for pattern in credential_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    findings.append({
-                        "severity": "CRITICAL",
-                        "message": "Hardcoded credentials found in code",
-                        "category": "security",
-                        "location": artifact.get("path", "unknown"),
-                        "evidence": "Hardcoded credentials detected",
-                        "suggestion": "Use environment variables or secret management system for credentials"
-                    })
-                    break
+            if _PY_CREDENTIALS_RE.search(content):
+                findings.append({
+                    "severity": "CRITICAL",
+                    "message": "Hardcoded credentials found in code",
+                    "category": "security",
+                    "location": artifact.get("path", "unknown"),
+                    "evidence": "Hardcoded credentials detected",
+                    "suggestion": "Use environment variables or secret management system for credentials"
+                })
             
             # Check for print statements (potential debug code)
-            if re.search(r"print\s*\(", content):
+            if _PRINT_RE.search(content):
                 findings.append({
                     "severity": "WARN",
                     "message": "Print statements found in code",
@@ -220,7 +229,7 @@ class QualityAuditorAgent(Agent):
                 })
             
             # Check for broad exception handling
-            if re.search(r"except:\s*pass", content):
+            if _EMPTY_EXCEPT_RE.search(content):
                 findings.append({
                     "severity": "ERROR",
                     "message": "Empty except block found",
@@ -231,7 +240,7 @@ class QualityAuditorAgent(Agent):
                 })
             
             # Check for proper docstrings
-            if not re.search(r'""".*"""', content, re.DOTALL) and not re.search(r"'''.*'''", content, re.DOTALL):
+            if not _DOCSTRING_RE.search(content):
                 findings.append({
                     "severity": "INFO",
                     "message": "Missing docstrings in code",
@@ -247,7 +256,7 @@ class QualityAuditorAgent(Agent):
             in_function = False
             
             for line in lines:
-                if re.match(r"\s*def\s+\w+", line):
+                if _DEF_RE.match(line):
                     in_function = True
                     function_line_count = 1
                 elif in_function:
@@ -262,7 +271,7 @@ class QualityAuditorAgent(Agent):
                             "suggestion": "Break down long functions into smaller, focused functions"
                         })
                         break
-                    elif line.strip() and not line.strip().startswith('#') and re.match(r"\s*def\s+\w+", line):
+                    elif line.strip() and not line.strip().startswith('#') and _DEF_RE.match(line):
                         in_function = False
         
         return findings
@@ -276,7 +285,7 @@ class QualityAuditorAgent(Agent):
             content = artifact["content"]
             
             # Check for console.log statements (potential debug code)
-            if re.search(r"console\.log\s*\(", content):
+            if _CONSOLE_LOG_RE.search(content):
                 findings.append({
                     "severity": "WARN",
                     "message": "Console.log statements found in code",
@@ -287,27 +296,18 @@ class QualityAuditorAgent(Agent):
                 })
             
             # Check for hardcoded credentials
-            credential_patterns = [
-                r"password\s*=\s*['\"][^'\"]+['\"]",
-                r"secret\s*=\s*['\"][^'\"]+['\"]",
-                r"apiKey\s*=\s*['\"][^'\"]+['\"]",
-                r"token\s*=\s*['\"][^'\"]+['\"]"
-            ]
-            
-            for pattern in credential_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    findings.append({
-                        "severity": "CRITICAL",
-                        "message": "Hardcoded credentials found in code",
-                        "category": "security",
-                        "location": artifact.get("path", "unknown"),
-                        "evidence": "Hardcoded credentials detected",
-                        "suggestion": "Use environment variables or secret management system for credentials"
-                    })
-                    break
+            if _JS_CREDENTIALS_RE.search(content):
+                findings.append({
+                    "severity": "CRITICAL",
+                    "message": "Hardcoded credentials found in code",
+                    "category": "security",
+                    "location": artifact.get("path", "unknown"),
+                    "evidence": "Hardcoded credentials detected",
+                    "suggestion": "Use environment variables or secret management system for credentials"
+                })
             
             # Check for proper error handling
-            if not re.search(r"try\s*\{", content):
+            if not _TRY_BLOCK_RE.search(content):
                 findings.append({
                     "severity": "INFO",
                     "message": "No try-catch blocks found in code",
@@ -318,7 +318,7 @@ class QualityAuditorAgent(Agent):
                 })
             
             # Check for async/await usage in modern JS
-            if re.search(r"async\s+function", content) and not re.search(r"await\s+\w+", content):
+            if _ASYNC_FUNCTION_RE.search(content) and not _AWAIT_RE.search(content):
                 findings.append({
                     "severity": "INFO",
                     "message": "Async function without await detected",
@@ -422,10 +422,11 @@ class QualityAuditorAgent(Agent):
         if not findings:
             return 100  # Perfect score if no findings
         
-        # Count findings by severity
-        error_count = sum(1 for f in findings if f.get("severity") == "ERROR")
-        warn_count = sum(1 for f in findings if f.get("severity") == "WARN")
-        info_count = sum(1 for f in findings if f.get("severity") == "INFO")
+        # Count findings by severity in a single pass
+        counts = Counter(f.get("severity") for f in findings)
+        error_count = counts["ERROR"]
+        warn_count = counts["WARN"]
+        info_count = counts["INFO"]
         
         # Calculate score (errors have higher weight)
         score = 100
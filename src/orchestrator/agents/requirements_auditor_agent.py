@@ -5,28 +5,10 @@ This agent is responsible for auditing requirements and ensuring they are clear
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from .base import PlaceholderAgent
 
-from .base import Agent
 
+class RequirementsAuditorAgent(PlaceholderAgent):
+    """Requirements Auditor Agent implementation."""
 
-class RequirementsAuditorAgent(Agent):
-    """Requirements Auditor Agent implementation.
-
-    The ``run`` method receives a context (which may be empty for the initial
-    call) and returns a minimal success payload.
-    """
-
-    def run(self, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        # In a full implementation this would audit requirements.
-        # For now, we provide a placeholder response.
-        return {
-            "status": "OK",
-            "summary": "Requirements auditor agent executed successfully",
-            "findings": [],
-            "artifacts": [],
-            "next_actions": [],
-            "context": context or {},
-            "trace_id": "placeholder-trace-id",
-            "execution_time_ms": 0,
-        }
+    summary = "Requirements auditor agent executed successfully"
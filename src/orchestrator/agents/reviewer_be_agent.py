@@ -5,28 +5,10 @@ This agent is responsible for reviewing backend code.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from .base import PlaceholderAgent
 
-from .base import Agent
 
+class ReviewerBEAgent(PlaceholderAgent):
+    """Backend Reviewer Agent implementation."""
 
-class ReviewerBEAgent(Agent):
-    """Backend Reviewer Agent implementation.
-
-    The ``run`` method receives a context (which may be empty for the initial
-    call) and returns a minimal success payload.
-    """
-
-    def run(self, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        # In a full implementation this would review backend code.
-        # For now, we provide a placeholder response.
-        return {
-            "status": "OK",
-            "summary": "Backend reviewer agent executed successfully",
-            "findings": [],
-            "artifacts": [],
-            "next_actions": [],
-            "context": context or {},
-            "trace_id": "placeholder-trace-id",
-            "execution_time_ms": 0,
-        }
+    summary = "Backend reviewer agent executed successfully"
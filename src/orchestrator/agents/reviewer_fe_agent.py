@@ -5,28 +5,10 @@ This agent is responsible for reviewing frontend code.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from .base import PlaceholderAgent
 
-from .base import Agent
 
+class ReviewerFEAgent(PlaceholderAgent):
+    """Frontend Reviewer Agent implementation."""
 
-class ReviewerFEAgent(Agent):
-    """Frontend Reviewer Agent implementation.
-
-    The ``run`` method receives a context (which may be empty for the initial
-    call) and returns a minimal success payload.
-    """
-
-    def run(self, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        # In a full implementation this would review frontend code.
-        # For now, we provide a placeholder response.
-        return {
-            "status": "OK",
-            "summary": "Frontend reviewer agent executed successfully",
-            "findings": [],
-            "artifacts": [],
-            "next_actions": [],
-            "context": context or {},
-            "trace_id": "placeholder-trace-id",
-            "execution_time_ms": 0,
-        }
+    summary = "Frontend reviewer agent executed successfully"
@@ -15,6 +15,7 @@ from orchestrator.config.loader import ConfigLoader
 from orchestrator.config.validator import ConfigValidator
 from orchestrator.display.formatter import WorkflowFormatter
 from orchestrator.main import run as run_workflow
+from orchestrator.workflow_engine import TaskStateEncoder
 
 
 @click.group()
@@ -47,8 +48,7 @@ def validate(workflow_file: str, verbose: bool):
             click.echo(f"Loading workflow file: {workflow_file}")
 
         workflow_path = Path(workflow_file)
-        docs = loader._load_yaml_file(workflow_path)
-        workflow_dict = docs[0] if isinstance(docs, list) else docs
+        workflow_dict = loader._load_yaml_first(workflow_path)
 
         # JSON Schema validation
         if verbose:
@@ -265,7 +265,7 @@ def run(workflow_file: str, parallel: bool, feedback_loop: bool, verbose: bool):
                     click.secho(f"  [{severity}] {finding['message']}", fg=color)
         
         # Output full JSON result
-        click.echo("\n" + json.dumps(result, ensure_ascii=False, indent=2))
+        click.echo("\n" + json.dumps(result, ensure_ascii=False, indent=2, cls=TaskStateEncoder))
         
     except FileNotFoundError as e:
         click.secho(f"✗ Error: {e}", fg="red", bold=True)
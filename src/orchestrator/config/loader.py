@@ -4,14 +4,22 @@ Configuration loader for YAML workflow files.
 Handles loading workflow configurations, template resolution, and multi-document YAML files.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 import yaml
 
+try:
+    # libyaml-backed loader (bundled with PyYAML wheels) is ~10x faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover – PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from orchestrator.config.models import WorkflowConfig, AgentConfig
+from orchestrator.config.validator import ConfigValidator
 from orchestrator.utils.constants import (
-    TEMPLATES_DIR,
-    AGENT_INTERFACE_SCHEMA_PATH,
+    templates_dir,
+    agent_interface_schema_path,
 )
 
 
@@ -76,7 +84,7 @@ class ConfigLoader:
         Raises:
             FileNotFoundError: If template doesn't exist
         """
-        template_path = TEMPLATES_DIR / f"{template_name}.yaml"
+        template_path = templates_dir() / f"{template_name}.yaml"
         if not template_path.exists():
             raise FileNotFoundError(f"Template not found: {template_name}")
 
@@ -89,11 +97,12 @@ class ConfigLoader:
         Returns:
             List of template names (without .yaml extension)
         """
-        if not TEMPLATES_DIR.exists():
+        templates_path = templates_dir()
+        if not templates_path.exists():
             return []
 
         templates = []
-        for template_file in TEMPLATES_DIR.glob("*.yaml"):
+        for template_file in templates_path.glob("*.yaml"):
             templates.append(template_file.stem)
 
         return sorted(templates)
@@ -112,7 +121,7 @@ class ConfigLoader:
             yaml.YAMLError: If YAML is invalid
         """
         with open(path, "r", encoding="utf-8") as f:
-            docs = list(yaml.safe_load_all(f))
+            docs = list(yaml.load_all(f, Loader=_YamlLoader))
 
         # Filter out None documents (trailing --- can create empty documents)
         docs = [doc for doc in docs if doc is not None]
@@ -124,6 +133,30 @@ class ConfigLoader:
         else:
             return docs
 
+    def _load_yaml_first(self, path: Path) -> dict:
+        """
+        Load only the first non-empty document of a YAML file.
+
+        The parser stops after that document, so trailing documents are never
+        parsed or built.
+
+        Args:
+            path: Path to YAML file
+
+        Returns:
+            The first document
+
+        Raises:
+            yaml.YAMLError: If the first document is invalid
+            ValueError: If the file contains no documents
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            for doc in yaml.load_all(f, Loader=_YamlLoader):
+                if doc is not None:
+                    return doc
+
+        raise ValueError(f"Empty YAML file: {path}")
+
     def _resolve_agent_templates(
         self, template_names: list[str], agents_config: dict[str, dict]
     ) -> dict[str, AgentConfig]:
@@ -181,12 +214,11 @@ class ConfigLoader:
         Raises:
             FileNotFoundError: If agent-interface.yaml doesn't exist
         """
-        if not AGENT_INTERFACE_SCHEMA_PATH.exists():
-            raise FileNotFoundError(
-                f"Agent interface schema not found: {AGENT_INTERFACE_SCHEMA_PATH}"
-            )
+        schema_path = agent_interface_schema_path()
+        if not schema_path.exists():
+            raise FileNotFoundError(f"Agent interface schema not found: {schema_path}")
 
-        docs = self._load_yaml_file(AGENT_INTERFACE_SCHEMA_PATH)
+        docs = self._load_yaml_file(schema_path)
 
         # agent-interface.yaml has multiple documents, templates are in the last one
         if isinstance(docs, list):
@@ -265,6 +297,48 @@ def load_workflow(path: str | Path) -> WorkflowConfig:
     return loader.load_workflow(path)
 
 
+def load_validated_workflow(path: str | Path) -> tuple[Optional[WorkflowConfig], tuple[str, ...]]:
+    """
+    Load a workflow file and validate it against the workflow schema.
+
+    Results are cached by (resolved path, size, mtime), so repeat loads of an
+    unchanged file skip YAML parsing and validation; callers must treat the
+    returned config as read-only.
+
+    Args:
+        path: Path to workflow YAML file
+
+    Returns:
+        ``(config, ())`` on success, or ``(None, errors)`` when schema
+        validation fails
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the YAML is invalid
+        ValidationError: If the configuration doesn't match the models
+    """
+    path = Path(path)
+    st = path.stat()
+    return _load_validated_workflow(str(path.resolve()), st.st_size, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_validated_workflow(
+    path: str, size: int, mtime_ns: int
+) -> tuple[Optional[WorkflowConfig], tuple[str, ...]]:
+    """Cached body of ``load_validated_workflow``; size and mtime only key the cache."""
+    loader = ConfigLoader()
+
+    # Load raw YAML for schema validation
+    workflow_dict = loader._load_yaml_first(Path(path))
+
+    is_valid, errors = ConfigValidator().validate_workflow(workflow_dict)
+    if not is_valid:
+        return None, tuple(errors)
+
+    return loader.load_workflow(path), ()
+
+
 def load_template(template_name: str) -> WorkflowConfig:
     """
     Convenience function to load a workflow template.
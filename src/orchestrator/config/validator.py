@@ -11,8 +11,8 @@ import jsonschema
 from jsonschema import SchemaError
 
 from orchestrator.utils.constants import (
-    WORKFLOW_SCHEMA_PATH,
-    AGENT_INTERFACE_SCHEMA_PATH,
+    workflow_schema_path,
+    agent_interface_schema_path,
 )
 
 
@@ -132,10 +132,11 @@ class ConfigValidator:
         if self._workflow_schema_cache is not None:
             return self._workflow_schema_cache
 
-        if not WORKFLOW_SCHEMA_PATH.exists():
-            raise FileNotFoundError(f"Workflow schema not found: {WORKFLOW_SCHEMA_PATH}")
+        schema_path = workflow_schema_path()
+        if not schema_path.exists():
+            raise FileNotFoundError(f"Workflow schema not found: {schema_path}")
 
-        with open(WORKFLOW_SCHEMA_PATH, "r", encoding="utf-8") as f:
+        with open(schema_path, "r", encoding="utf-8") as f:
             docs = list(yaml.safe_load_all(f))
 
         # First document is the schema
@@ -155,12 +156,11 @@ class ConfigValidator:
         if self._agent_schema_cache is not None:
             return self._agent_schema_cache
 
-        if not AGENT_INTERFACE_SCHEMA_PATH.exists():
-            raise FileNotFoundError(
-                f"Agent interface schema not found: {AGENT_INTERFACE_SCHEMA_PATH}"
-            )
+        schema_path = agent_interface_schema_path()
+        if not schema_path.exists():
+            raise FileNotFoundError(f"Agent interface schema not found: {schema_path}")
 
-        with open(AGENT_INTERFACE_SCHEMA_PATH, "r", encoding="utf-8") as f:
+        with open(schema_path, "r", encoding="utf-8") as f:
             docs = list(yaml.safe_load_all(f))
 
         # First document is the schema
@@ -7,6 +7,8 @@ import logging
 import logging.config
 from typing import Dict, Any
 
+from orchestrator.utils.constants import LOGGING_LEVEL
+
 
 DEFAULT_LOGGING_CONFIG: Dict[str, Any] = {
     "version": 1,
@@ -36,7 +38,9 @@ DEFAULT_LOGGING_CONFIG: Dict[str, Any] = {
     },
     "loggers": {
         "orchestrator": {
-            "level": "DEBUG",
+            # DEBUG chatter (e.g. per-task engine logs) stays off unless
+            # LOGGING_LEVEL is lowered
+            "level": LOGGING_LEVEL,
             "handlers": ["console", "file"],
             "propagate": False,
         },
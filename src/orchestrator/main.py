@@ -15,22 +15,23 @@ of concrete agent classes later in the project.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import sys
 from pathlib import Path
 
 from orchestrator.config.models import WorkflowConfig
-from typing import List, Optional
+from pydantic import ValidationError
+from typing import List
 
-from orchestrator.config.loader import ConfigLoader
-from orchestrator.config.validator import ConfigValidator
+from orchestrator.config.loader import load_validated_workflow
 from orchestrator.utils.constants import LOGGING_LEVEL
 from orchestrator.parallel.orchestrator import ParallelOrchestrator
 from orchestrator.agents.registry import AgentRegistry
 
 
 # Import feedback loop workflow engine
-from orchestrator.workflow_engine import run_workflow_with_feedback
+from orchestrator.workflow_engine import TaskStateEncoder, run_workflow_with_feedback
 
 
 # Simple logger – in a full implementation this would be replaced by a structured
@@ -44,29 +45,23 @@ def _load_and_validate(workflow_path: Path) -> "WorkflowConfig":
     """Load a workflow file and validate it.
 
     Returns the parsed ``WorkflowConfig`` model on success; exits the process on
-    validation failure.
+    validation failure. Results are cached until the file's size or mtime
+    changes, so callers must treat the returned config as read-only.
     """
-    loader = ConfigLoader()
-    validator = ConfigValidator()
-
-    # Load raw YAML for schema validation
-    raw_docs = loader._load_yaml_file(workflow_path)
-    workflow_dict = raw_docs[0] if isinstance(raw_docs, list) else raw_docs
+    # File and YAML errors propagate to the caller; model validation failures
+    # are reported like schema failures
+    try:
+        config, errors = load_validated_workflow(workflow_path)
+    except ValidationError as exc:
+        _log(f"Pydantic validation error: {exc}", level="ERROR")
+        sys.exit(1)
 
-    is_valid, errors = validator.validate_workflow(workflow_dict)
-    if not is_valid:
+    if config is None:
         _log("Workflow validation failed:", level="ERROR")
         for err in errors:
             _log(f"  - {err}", level="ERROR")
         sys.exit(1)
 
-    # Pydantic validation (will raise ValidationError on failure)
-    try:
-        config = loader.load_workflow(workflow_path)
-    except Exception as exc:  # pragma: no cover – defensive
-        _log(f"Pydantic validation error: {exc}", level="ERROR")
-        sys.exit(1)
-
     _log("Workflow configuration loaded and validated successfully")
     return config
 
@@ -91,7 +86,8 @@ def run(workflow_file: str, use_parallel: bool = False, use_feedback_loop: bool
     config = _load_and_validate(workflow_path)
 
     if use_feedback_loop:
-        return run_workflow_with_feedback(workflow_path)
+        # Hand over the validated config so the engine doesn't re-parse the file
+        return run_workflow_with_feedback(config)
     elif use_parallel:
         return _run_parallel_workflow(config)
     else:
@@ -120,6 +116,16 @@ def _run_sequential_workflow(config: WorkflowConfig) -> dict:
 
 def _run_parallel_workflow(config: WorkflowConfig) -> dict:
     """Run workflow using parallel execution."""
+    return asyncio.run(_run_parallel_workflow_async(config))
+
+
+async def _run_parallel_workflow_async(config: WorkflowConfig) -> dict:
+    """Run workflow using parallel execution, fanning in on the event loop.
+
+    Agents run on the orchestrator's worker pool (which bounds concurrency);
+    their completion futures are awaited as they finish instead of blocking a
+    thread per task.
+    """
     import time
     import uuid
     
@@ -128,33 +134,40 @@ def _run_parallel_workflow(config: WorkflowConfig) -> dict:
     # Create parallel orchestrator
     orchestrator = ParallelOrchestrator(agent_registry=AgentRegistry())
     
-    # Submit tasks for all stages
-    task_ids = []
-    for stage in config.workflow.stages:
-        for agent in stage.agents:
-            task_id = orchestrator.submit_task(
-                agent_type=agent,
-                payload={
-                    "stage": stage.name,
-                    "config": config.dict(),
-                    "workflow": config.workflow.dict()
-                }
-            )
-            task_ids.append(task_id)
-    
-    # Wait for all tasks to complete
-    for task_id in task_ids:
-        orchestrator.wait_for_completion(task_id)
+    # Submit tasks for all stages. The config snapshots are dumped once and
+    # shared by every payload, so agents must treat them as read-only.
+    config_dict = config.dict()
+    workflow_dict = config_dict["workflow"]
+    task_ids = orchestrator.submit_batch([
+        {
+            "agent_type": agent,
+            "payload": {
+                "stage": stage.name,
+                "config": config_dict,
+                "workflow": workflow_dict
+            }
+        }
+        for stage in config.workflow.stages
+        for agent in stage.agents
+    ])
     
-    # Collect results
+    # Collect results as tasks finish so aggregation overlaps slow agents;
+    # failed and cancelled tasks are skipped. Cancelling this coroutine
+    # still propagates out of asyncio.wait.
     results = []
-    for task_id in task_ids:
-        result = orchestrator.get_task_result(task_id)
-        if result:
-            results.append(result)
-    
-    # Shutdown orchestrator
-    orchestrator.shutdown()
+    try:
+        pending = {asyncio.wrap_future(orchestrator.get_task_future(task_id)) for task_id in task_ids}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                if fut.cancelled() or fut.exception() is not None:
+                    continue
+                result = fut.result()
+                if result:
+                    results.append(result)
+    finally:
+        # Shutdown orchestrator, also when cancelled or failing
+        orchestrator.shutdown()
     
     execution_time = time.time() - start_time
     
@@ -187,7 +200,7 @@ def main() -> None:
         _log("Usage: python -m orchestrator.main <workflow.yaml>", level="ERROR")
         sys.exit(1)
     result = run(sys.argv[1])
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(json.dumps(result, ensure_ascii=False, indent=2, cls=TaskStateEncoder))
 
 
 if __name__ == "__main__":
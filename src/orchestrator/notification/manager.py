@@ -7,6 +7,7 @@ to provide status change notifications, feedback requests, and approval notifica
 from __future__ import annotations
 
 import threading
+from collections import Counter
 from typing import Any, Dict, List, Optional, Callable
 from dataclasses import dataclass, field
 import time
@@ -68,6 +69,12 @@ class NotificationManager:
             else:
                 return sum(1 for n in self._notifications if not n.read)
     
+    def get_unread_counts(self) -> Dict[NotificationType, int]:
+        """Get unread counts for every notification type in a single pass."""
+        with self._lock:
+            counts = Counter(n.notification_type for n in self._notifications if not n.read)
+        return {notification_type: counts[notification_type] for notification_type in NotificationType}
+    
     def mark_notification_as_read(self, notification_id: str) -> bool:
         """Mark a notification as read."""
         with self._lock:
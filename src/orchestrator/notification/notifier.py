@@ -105,19 +105,27 @@ class Notifier:
         task_id: str,
         old_status: str,
         new_status: str,
-        reason: str = ""
+        reason: str = "",
+        path: Optional[List[str]] = None
     ) -> Notification:
-        """Send a status change notification."""
+        """Send a status change notification.
+
+        ``path`` lists the statuses passed through when several transitions
+        were applied at once.
+        """
+        context = {
+            "task_id": task_id,
+            "old_status": old_status,
+            "new_status": new_status,
+            "reason": reason
+        }
+        if path:
+            context["path"] = path
         return self.send_notification(
             notification_type=NotificationType.STATUS_CHANGE,
             title=f"Task Status Changed: {task_id}",
             message=f"Task {task_id} status changed from {old_status} to {new_status}",
-            context={
-                "task_id": task_id,
-                "old_status": old_status,
-                "new_status": new_status,
-                "reason": reason
-            },
+            context=context,
             priority=NotificationPriority.MEDIUM
         )
     
@@ -10,13 +10,17 @@ This module provides monitoring capabilities for:
 
 import threading
 import time
-import psutil
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass
 from collections import deque
 
 from .task_queue import Task, TaskStatus
 
+try:
+    import psutil
+except ImportError:  # pragma: no cover – psutil is optional
+    psutil = None
+
 
 @dataclass
 class SystemMetrics:
@@ -30,8 +34,11 @@ class SystemMetrics:
     @classmethod
     def capture(cls) -> 'SystemMetrics':
         """Capture current system metrics."""
+        if psutil is None:
+            return _DUMMY_METRICS
         try:
-            cpu = psutil.cpu_percent(interval=0.1)
+            # Non-blocking: usage since the previous call (primed by ResourceMonitor)
+            cpu = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
@@ -53,6 +60,10 @@ class SystemMetrics:
             )
 
 
+# Returned when psutil is unavailable; never mutated
+_DUMMY_METRICS = SystemMetrics(timestamp=0.0, cpu_usage=0.0, memory_usage=0, memory_total=1, disk_usage=0)
+
+
 @dataclass
 class TaskMetrics:
     """Task execution metrics."""
@@ -73,44 +84,94 @@ class ResourceMonitor:
         self.monitoring_interval = monitoring_interval
         self.history_size = history_size
         self.system_metrics_history = deque(maxlen=history_size)
+        # Running sums over system_metrics_history so averages are O(1)
+        self._cpu_sum = 0.0
+        self._memory_sum = 0.0
         self.task_metrics_history = deque(maxlen=history_size)
         self.running = False
+        # Set by stop(); the loop waits on it so shutdown doesn't sit out the interval
+        self._stop_event = threading.Event()
         self.monitor_thread = None
         self.lock = threading.Lock()
+        # Signalled whenever a system sample is recorded (see wait_for_sample)
+        self._sampled = threading.Condition(self.lock)
         self.callbacks = []
+        # Without psutil every sample would be dummy zeros, so don't run the loop
+        self._disabled = psutil is None
+        if not self._disabled:
+            try:
+                # Prime the non-blocking CPU counter so the first sample is meaningful
+                psutil.cpu_percent(interval=None)
+            except Exception:
+                self._disabled = True
 
     def start(self):
-        """Start the resource monitor."""
+        """Start the resource monitor (a no-op when psutil is unavailable)."""
+        if self._disabled:
+            return
         if not self.running:
             self.running = True
+            self._stop_event.clear()
             self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.monitor_thread.start()
 
     def stop(self):
         """Stop the resource monitor."""
         self.running = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join()
 
     def _monitor_loop(self):
         """Main monitoring loop."""
-        while self.running:
+        while not self._stop_event.is_set():
             try:
-                # Capture system metrics
-                system_metrics = SystemMetrics.capture()
-                
-                with self.lock:
-                    self.system_metrics_history.append(system_metrics)
-                
-                # Notify callbacks
-                self._notify_callbacks(system_metrics)
+                self.sample_once()
                 
-                # Sleep for the monitoring interval
-                time.sleep(self.monitoring_interval)
+                # Sleep for the monitoring interval, waking early on stop()
+                self._stop_event.wait(self.monitoring_interval)
             except Exception as e:
                 # Log error and continue
                 print(f"Monitoring error: {e}")
-                time.sleep(self.monitoring_interval)
+                self._stop_event.wait(self.monitoring_interval)
+
+    def sample_once(self) -> SystemMetrics:
+        """Capture, record and publish one system sample on the calling thread.
+
+        Useful when the background loop is not running or its interval is
+        long. Without psutil nothing is recorded and dummy metrics are returned.
+        """
+        system_metrics = SystemMetrics.capture()
+        if self._disabled:
+            return system_metrics
+        
+        self._record_system_metrics(system_metrics)
+        self._notify_callbacks(system_metrics)
+        return system_metrics
+
+    def _record_system_metrics(self, metrics: SystemMetrics):
+        """Append a system sample, keeping the running sums in step with the bounded history."""
+        with self.lock:
+            history = self.system_metrics_history
+            if len(history) == history.maxlen:
+                evicted = history[0]
+                self._cpu_sum -= evicted.cpu_usage
+                self._memory_sum -= evicted.memory_usage
+            history.append(metrics)
+            self._cpu_sum += metrics.cpu_usage
+            self._memory_sum += metrics.memory_usage
+            self._sampled.notify_all()
+
+    def wait_for_sample(self, timeout: Optional[float] = None) -> bool:
+        """Block until at least one system sample has been recorded.
+
+        Returns ``False`` on timeout, or straight away when monitoring is
+        disabled because psutil is unavailable.
+        """
+        if self._disabled:
+            return False
+        with self._sampled:
+            return bool(self._sampled.wait_for(lambda: self.system_metrics_history, timeout))
 
     def record_task_metrics(self, task: Task):
         """Record metrics for a completed task."""
@@ -160,24 +221,27 @@ class ResourceMonitor:
 
     def _notify_callbacks(self, metrics: SystemMetrics):
         """Notify all registered callbacks."""
+        # Snapshot under the lock, call outside it so a slow callback never
+        # blocks task metric recording or readers
         with self.lock:
-            for callback in self.callbacks:
-                try:
-                    callback(metrics)
-                except Exception:
-                    # Don't let callback errors crash the monitor
-                    pass
+            callbacks = tuple(self.callbacks)
+        for callback in callbacks:
+            try:
+                callback(metrics)
+            except Exception:
+                # Don't let callback errors crash the monitor
+                pass
 
     def get_average_cpu_usage(self) -> float:
         """Get the average CPU usage over the monitoring period."""
         with self.lock:
             if not self.system_metrics_history:
                 return 0.0
-            return sum(m.cpu_usage for m in self.system_metrics_history) / len(self.system_metrics_history)
+            return self._cpu_sum / len(self.system_metrics_history)
 
     def get_average_memory_usage(self) -> float:
         """Get the average memory usage over the monitoring period."""
         with self.lock:
             if not self.system_metrics_history:
                 return 0.0
-            return sum(m.memory_usage for m in self.system_metrics_history) / len(self.system_metrics_history)
\ No newline at end of file
+            return self._memory_sum / len(self.system_metrics_history)
\ No newline at end of file
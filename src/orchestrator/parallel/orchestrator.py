@@ -7,7 +7,8 @@ a high-level interface for parallel agent execution.
 
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from orchestrator.context import ContextManager
 from orchestrator.agents.registry import AgentRegistry, registry
@@ -60,17 +61,16 @@ class ParallelOrchestrator:
 
     def submit_batch(self, tasks: List[Dict[str, Any]]) -> List[str]:
         """Submit a batch of tasks."""
-        task_ids = []
-        for task in tasks:
-            task_id = self.submit_task(
-                agent_type=task['agent_type'],
-                payload=task['payload'],
-                priority=getattr(TaskPriority, task.get('priority', 'MEDIUM')),
-                timeout=task.get('timeout'),
-                dependencies=task.get('dependencies')
+        return self.task_queue.add_tasks_bulk(
+            (
+                task['agent_type'],
+                task['payload'],
+                getattr(TaskPriority, task.get('priority', 'MEDIUM')),
+                task.get('timeout'),
+                task.get('dependencies')
             )
-            task_ids.append(task_id)
-        return task_ids
+            for task in tasks
+        )
 
     def get_task_status(self, task_id: str) -> Optional[str]:
         """Get the status of a task."""
@@ -81,18 +81,25 @@ class ParallelOrchestrator:
         """Get the result of a completed task."""
         return self.task_queue.get_task_result(task_id)
 
+    def get_task_results(self, task_ids: Iterable[str]) -> Dict[str, Any]:
+        """Get the results of all completed tasks among ``task_ids``."""
+        return self.task_queue.get_task_results(task_ids)
+
+    def get_task_future(self, task_id: str) -> Optional[Future]:
+        """Get a future that resolves when the task finishes."""
+        return self.task_queue.get_task_future(task_id)
+
     def wait_for_completion(self, task_id: str, timeout: Optional[float] = None) -> bool:
         """Wait for a task to complete."""
-        start_time = time.time()
-        while True:
-            status = self.task_queue.get_task_status(task_id)
-            if status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED, TaskStatus.TIMEOUT):
-                return True
-            
-            if timeout is not None and (time.time() - start_time) > timeout:
-                return False
-            
-            time.sleep(0.1)
+        return self.task_queue.wait_all([task_id], timeout)
+
+    def wait_all(self, task_ids: Iterable[str], timeout: Optional[float] = None) -> bool:
+        """Wait for all given tasks to complete."""
+        return self.task_queue.wait_all(task_ids, timeout)
+
+    def completions(self, task_ids: Iterable[str], timeout: Optional[float] = None) -> Iterator[Task]:
+        """Yield the given tasks as they finish, in completion order."""
+        return self.task_queue.completions(task_ids, timeout)
 
     def cancel_task(self, task_id: str) -> bool:
         """Cancel a pending task."""
@@ -143,6 +150,13 @@ class ParallelOrchestrator:
         if self.processing_thread:
             self.processing_thread.join()
 
+    def _on_task_finished(self, task: Task):
+        """Propagate a finished task's outcome to the task queue."""
+        if task.status == TaskStatus.COMPLETED:
+            self.task_queue.complete_task(task.task_id, task.result)
+        else:
+            self.task_queue.fail_task(task.task_id, task.error or "Task failed")
+
     def _process_tasks(self):
         """Main task processing loop."""
         while self.running:
@@ -159,7 +173,7 @@ class ParallelOrchestrator:
                         context = ContextManager()
                         
                         # Execute task
-                        worker_pool.execute_task(task, context)
+                        worker_pool.execute_task(task, context, on_complete=self._on_task_finished)
                         
                         # Record task metrics
                         self.resource_monitor.record_task_metrics(task)
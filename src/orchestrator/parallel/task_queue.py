@@ -9,20 +9,25 @@ This module implements a priority-based task queue that supports:
 """
 
 import heapq
+import itertools
 import threading
 import time
 import uuid
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Callable, Tuple
 
 
 class TaskPriority(Enum):
-    """Task priority levels."""
-    CRITICAL = auto()
-    HIGH = auto()
-    MEDIUM = auto()
-    LOW = auto()
+    """Task priority levels.
+
+    Values are the heap keys: lower values are dequeued first.
+    """
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
 
 
 class TaskStatus(Enum):
@@ -35,12 +40,8 @@ class TaskStatus(Enum):
     TIMEOUT = auto()
 
 
-@dataclass(order=True)
-class PrioritizedTask:
-    """Task with priority for queue ordering."""
-    priority: int
-    task_id: str = field(compare=False)
-    task: 'Task' = field(compare=False)
+# Statuses after which a task will not change anymore
+TERMINAL_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED, TaskStatus.TIMEOUT)
 
 
 @dataclass
@@ -64,10 +65,22 @@ class TaskQueue:
     """Priority-based task queue for parallel agent processing."""
 
     def __init__(self):
+        # Heap of (priority value, submission sequence, Task) tuples; the
+        # sequence keeps equal priorities FIFO and makes every entry unique,
+        # so Task objects are never compared
         self._queue = []
+        self._sequence = itertools.count()
         self._tasks = {}  # task_id -> Task
+        self._futures = {}  # task_id -> Future resolved when the task finishes
+        # Dependency DAG: tasks with unmet dependencies stay out of the heap
+        # until their last dependency completes or is cancelled
+        self._dependents = {}  # task_id -> ids of tasks waiting on it
+        self._waiting = {}  # task_id -> (heap entry, number of unmet dependencies)
         self._lock = threading.Lock()
         self._condition = threading.Condition(self._lock)
+        # Separate condition for completion waiters so they never consume the
+        # single notify() meant for the dispatcher in add_task
+        self._finished = threading.Condition(self._lock)
         self._running = True
 
     def add_task(self, agent_type: str, payload: Dict[str, Any], 
@@ -75,25 +88,35 @@ class TaskQueue:
                  timeout: Optional[float] = None,
                  dependencies: Optional[List[str]] = None) -> str:
         """Add a new task to the queue."""
-        task_id = str(uuid.uuid4())
+        # Build everything outside the lock so concurrent producers only
+        # serialize on the dict inserts and the heap push
+        task, future = self._build_task(agent_type, payload, priority, timeout, dependencies)
         
-        task = Task(
-            task_id=task_id,
-            agent_type=agent_type,
-            payload=payload,
-            priority=priority,
-            timeout=timeout,
-            dependencies=dependencies or []
-        )
+        with self._lock:
+            entry = self._register_task(task, future)
+            if entry is not None:
+                heapq.heappush(self._queue, entry)
+                self._condition.notify()
+        
+        return task.task_id
+
+    def add_tasks_bulk(self, specs: Iterable[Tuple[str, Dict[str, Any], TaskPriority, Optional[float], Optional[List[str]]]]) -> List[str]:
+        """Add several tasks under a single lock acquisition.
+
+        Each spec is an ``(agent_type, payload, priority, timeout, dependencies)``
+        tuple. Returns the new task ids in spec order.
+        """
+        built = [self._build_task(*spec) for spec in specs]
         
         with self._lock:
-            self._tasks[task_id] = task
-            # Convert priority to numeric value for heapq
-            priority_value = self._priority_to_value(priority)
-            heapq.heappush(self._queue, PrioritizedTask(priority_value, task_id, task))
-            self._condition.notify()
+            entries = [self._register_task(task, future) for task, future in built]
+            ready = [entry for entry in entries if entry is not None]
+            if ready:
+                self._queue.extend(ready)
+                heapq.heapify(self._queue)
+                self._condition.notify_all()
         
-        return task_id
+        return [task.task_id for task, _ in built]
 
     def get_next_task(self, timeout: Optional[float] = None) -> Optional[Task]:
         """Get the next task from the queue."""
@@ -111,14 +134,8 @@ class TaskQueue:
             if not self._queue:
                 return None
             
-            prioritized_task = heapq.heappop(self._queue)
-            task = self._tasks[prioritized_task.task_id]
-            
-            # Check if task can be executed (dependencies satisfied)
-            if not self._can_execute_task(task):
-                # Put it back in the queue
-                heapq.heappush(self._queue, prioritized_task)
-                return None
+            # Only tasks whose dependencies are satisfied are ever in the heap
+            _, _, task = heapq.heappop(self._queue)
             
             task.status = TaskStatus.RUNNING
             task.started_at = time.time()
@@ -132,7 +149,10 @@ class TaskQueue:
                 task.status = TaskStatus.COMPLETED
                 task.result = result
                 task.completed_at = time.time()
+                self._resolve_future(task_id, result=result)
+                self._release_dependents(task_id)
                 self._condition.notify_all()
+                self._finished.notify_all()
 
     def fail_task(self, task_id: str, error: str):
         """Mark a task as failed."""
@@ -142,7 +162,9 @@ class TaskQueue:
                 task.status = TaskStatus.FAILED
                 task.error = error
                 task.completed_at = time.time()
+                self._resolve_future(task_id, error=error)
                 self._condition.notify_all()
+                self._finished.notify_all()
 
     def cancel_task(self, task_id: str):
         """Cancel a task."""
@@ -152,7 +174,12 @@ class TaskQueue:
                 if task.status in (TaskStatus.PENDING, TaskStatus.RUNNING):
                     task.status = TaskStatus.CANCELLED
                     task.completed_at = time.time()
+                    future = self._futures.get(task_id)
+                    if future and future.cancel():
+                        future.set_running_or_notify_cancel()
+                    self._release_dependents(task_id)
                     self._condition.notify_all()
+                    self._finished.notify_all()
                     return True
         return False
 
@@ -170,29 +197,127 @@ class TaskQueue:
                 return task.result
             return None
 
+    def wait_all(self, task_ids: Iterable[str], timeout: Optional[float] = None) -> bool:
+        """Block until every task in ``task_ids`` has finished.
+
+        Unknown task ids are treated as finished. Returns ``False`` if the
+        timeout expired first.
+        """
+        task_ids = list(task_ids)
+        
+        def all_finished() -> bool:
+            for task_id in task_ids:
+                task = self._tasks.get(task_id)
+                if task and task.status not in TERMINAL_STATUSES:
+                    return False
+            return True
+        
+        with self._finished:
+            return self._finished.wait_for(all_finished, timeout)
+
+    def completions(self, task_ids: Iterable[str], timeout: Optional[float] = None) -> Iterator[Task]:
+        """Yield tasks from ``task_ids`` as they finish, in completion order.
+
+        Unknown task ids are skipped. Stops early if ``timeout`` expires before
+        every task has finished. Tasks are yielded outside the lock.
+        """
+        pending = set(task_ids)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        def finished_ids() -> List[str]:
+            return [task_id for task_id in pending
+                    if task_id not in self._tasks or self._tasks[task_id].status in TERMINAL_STATUSES]
+        
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            with self._finished:
+                done = self._finished.wait_for(finished_ids, remaining)
+                finished = [self._tasks.get(task_id) for task_id in done]
+            if not done:
+                return
+            pending.difference_update(done)
+            for task in finished:
+                if task is not None:
+                    yield task
+
+    def get_task_results(self, task_ids: Iterable[str]) -> Dict[str, Any]:
+        """Get the results of all completed tasks among ``task_ids`` in one lock acquisition."""
+        with self._lock:
+            results = {}
+            for task_id in task_ids:
+                task = self._tasks.get(task_id)
+                if task and task.status == TaskStatus.COMPLETED:
+                    results[task_id] = task.result
+            return results
+
+    def get_task_future(self, task_id: str) -> Optional[Future]:
+        """Get a future that resolves when the task completes, fails or is cancelled.
+
+        The future's result is the task result; failed tasks resolve with a
+        ``RuntimeError`` carrying the task error.
+        """
+        with self._lock:
+            return self._futures.get(task_id)
+
     def shutdown(self):
         """Shutdown the task queue."""
         with self._lock:
             self._running = False
             self._condition.notify_all()
 
-    def _priority_to_value(self, priority: TaskPriority) -> int:
-        """Convert priority enum to numeric value for heapq."""
-        priority_map = {
-            TaskPriority.CRITICAL: 0,
-            TaskPriority.HIGH: 1,
-            TaskPriority.MEDIUM: 2,
-            TaskPriority.LOW: 3
-        }
-        return priority_map[priority]
-
-    def _can_execute_task(self, task: Task) -> bool:
-        """Check if a task can be executed (dependencies satisfied)."""
-        if not task.dependencies:
-            return True
+    def _build_task(self, agent_type: str, payload: Dict[str, Any],
+                    priority: TaskPriority = TaskPriority.MEDIUM,
+                    timeout: Optional[float] = None,
+                    dependencies: Optional[List[str]] = None) -> Tuple[Task, Future]:
+        """Create a task and its completion future (no lock needed)."""
+        task_id = uuid.uuid4().hex
+        
+        task = Task(
+            task_id=task_id,
+            agent_type=agent_type,
+            payload=payload,
+            priority=priority,
+            timeout=timeout,
+            dependencies=dependencies or []
+        )
         
+        return task, Future()
+
+    def _register_task(self, task: Task, future: Future) -> Optional[Tuple[int, int, Task]]:
+        """Record a new task and return its heap entry if it is ready to be queued (caller must hold the lock).
+
+        Tasks with unmet dependencies are parked until ``_release_dependents``
+        queues them, and ``None`` is returned.
+        """
+        entry = (task.priority.value, next(self._sequence), task)
+        self._tasks[task.task_id] = task
+        self._futures[task.task_id] = future
+        unmet = 0
         for dep_id in task.dependencies:
             dep_task = self._tasks.get(dep_id)
             if not dep_task or dep_task.status not in (TaskStatus.COMPLETED, TaskStatus.CANCELLED):
-                return False
-        return True
\ No newline at end of file
+                self._dependents.setdefault(dep_id, []).append(task.task_id)
+                unmet += 1
+        if unmet:
+            self._waiting[task.task_id] = (entry, unmet)
+            return None
+        return entry
+
+    def _resolve_future(self, task_id: str, result: Any = None, error: Optional[str] = None):
+        """Resolve the completion future of a task (caller must hold the lock)."""
+        future = self._futures.get(task_id)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(RuntimeError(error))
+        else:
+            future.set_result(result)
+
+    def _release_dependents(self, task_id: str):
+        """Push dependents whose last unmet dependency was ``task_id`` onto the heap (caller must hold the lock)."""
+        for dependent_id in self._dependents.pop(task_id, ()):
+            entry, unmet = self._waiting.pop(dependent_id)
+            if unmet > 1:
+                self._waiting[dependent_id] = (entry, unmet - 1)
+            else:
+                heapq.heappush(self._queue, entry)
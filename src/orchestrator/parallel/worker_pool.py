@@ -34,19 +34,25 @@ class WorkerPool:
         self.lock = threading.Lock()
         self.running = True
 
-    def execute_task(self, task: Task, context: ContextManager) -> str:
-        """Execute a task using the worker pool."""
+    def execute_task(self, task: Task, context: ContextManager,
+                     on_complete: Optional[Callable[[Task], None]] = None) -> str:
+        """Execute a task using the worker pool.
+
+        ``on_complete`` is invoked with the task once it has finished, whether
+        it completed or failed.
+        """
         if not self.running:
             raise RuntimeError("Worker pool is not running")
         
-        future = self.executor.submit(self._execute_task_worker, task, context)
+        future = self.executor.submit(self._execute_task_worker, task, context, on_complete)
         
         with self.lock:
             self.active_tasks[task.task_id] = future
         
         return task.task_id
 
-    def _execute_task_worker(self, task: Task, context: ContextManager):
+    def _execute_task_worker(self, task: Task, context: ContextManager,
+                             on_complete: Optional[Callable[[Task], None]] = None):
         """Worker function to execute a single task."""
         try:
             # Load the appropriate agent
@@ -70,6 +76,9 @@ class WorkerPool:
             with self.lock:
                 if task.task_id in self.active_tasks:
                     del self.active_tasks[task.task_id]
+            
+            if on_complete:
+                on_complete(task)
 
     def get_active_task_count(self) -> int:
         """Get the number of currently active tasks."""
@@ -3,25 +3,85 @@ Constants and enumerations for the orchestrator system.
 """
 
 from enum import Enum
+from functools import cache
 from pathlib import Path
+from typing import Any, TypeVar
+
+E = TypeVar("E", bound=Enum)
 
 # ===== Path Definitions =====
+#
+# Paths are materialized on first use rather than at import time, so code that
+# never touches schemas/templates/policies does not pay for them. The legacy
+# upper-case names (``SCHEMAS_DIR`` etc.) remain available through the module
+# ``__getattr__`` below.
+
+
+@cache
+def project_root() -> Path:
+    """Project root directory."""
+    return Path(__file__).parent.parent.parent.parent
+
+
+@cache
+def schemas_dir() -> Path:
+    """Directory containing the YAML schemas."""
+    return project_root() / "schemas"
+
+
+@cache
+def templates_dir() -> Path:
+    """Directory containing the built-in workflow templates."""
+    return project_root() / "templates"
+
+
+@cache
+def policies_dir() -> Path:
+    """Directory containing the policy files."""
+    return project_root() / "policies"
+
 
-# Project root directory
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+@cache
+def workflow_schema_path() -> Path:
+    """Path to the workflow schema."""
+    return schemas_dir() / "workflow-schema.yaml"
 
-# Configuration directories
-SCHEMAS_DIR = PROJECT_ROOT / "schemas"
-TEMPLATES_DIR = PROJECT_ROOT / "templates"
-POLICIES_DIR = PROJECT_ROOT / "policies"
 
-# Schema file paths
-WORKFLOW_SCHEMA_PATH = SCHEMAS_DIR / "workflow-schema.yaml"
-AGENT_INTERFACE_SCHEMA_PATH = SCHEMAS_DIR / "agent-interface.yaml"
+@cache
+def agent_interface_schema_path() -> Path:
+    """Path to the agent interface schema."""
+    return schemas_dir() / "agent-interface.yaml"
 
-# Policy file paths
-LANGUAGE_POLICY_PATH = POLICIES_DIR / "language-policy.yaml"
-FILE_POLICY_PATH = POLICIES_DIR / "file-policy.yaml"
+
+@cache
+def language_policy_path() -> Path:
+    """Path to the language policy."""
+    return policies_dir() / "language-policy.yaml"
+
+
+@cache
+def file_policy_path() -> Path:
+    """Path to the file operation policy."""
+    return policies_dir() / "file-policy.yaml"
+
+
+_LAZY_PATHS = {
+    "PROJECT_ROOT": project_root,
+    "SCHEMAS_DIR": schemas_dir,
+    "TEMPLATES_DIR": templates_dir,
+    "POLICIES_DIR": policies_dir,
+    "WORKFLOW_SCHEMA_PATH": workflow_schema_path,
+    "AGENT_INTERFACE_SCHEMA_PATH": agent_interface_schema_path,
+    "LANGUAGE_POLICY_PATH": language_policy_path,
+    "FILE_POLICY_PATH": file_policy_path,
+}
+
+
+def __getattr__(name: str) -> Path:
+    """Resolve legacy path constants lazily."""
+    if name in _LAZY_PATHS:
+        return _LAZY_PATHS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ===== Enumerations =====
@@ -138,6 +198,58 @@ class AgentTemplateCategory(str, Enum):
     DEVOPS = "devops"
 
 
+# ===== Enum Coercion =====
+
+# Value -> member lookup tables, keyed by enum class. Populated eagerly for the
+# enums defined above and lazily for any other enum passed to ``to_enum``.
+STR_TO_ENUM: dict[type[Enum], dict[Any, Enum]] = {
+    enum_cls: {member.value: member for member in enum_cls}
+    for enum_cls in (
+        ProjectType,
+        ExecutionMode,
+        AgentRole,
+        Status,
+        RequiredStatus,
+        Severity,
+        ArtifactType,
+        BackoffType,
+        OnFailureAction,
+        FallbackCondition,
+        FallbackAction,
+        AgentTemplateCategory,
+    )
+}
+
+
+def to_enum(enum_cls: type[E], value: Any) -> E:
+    """
+    Coerce a raw value to a member of ``enum_cls`` using a precomputed lookup.
+
+    Args:
+        enum_cls: Target enum class
+        value: Raw value (e.g. a string read from YAML/JSON) or an existing member
+
+    Returns:
+        The matching enum member
+
+    Raises:
+        ValueError: If ``value`` is not a valid value for ``enum_cls``
+    """
+    if isinstance(value, enum_cls):
+        return value
+
+    value_map = STR_TO_ENUM.get(enum_cls)
+    if value_map is None:
+        value_map = {member.value: member for member in enum_cls}
+        STR_TO_ENUM[enum_cls] = value_map
+
+    try:
+        return value_map[value]  # type: ignore[return-value]
+    except (KeyError, TypeError):
+        # Defer to Enum.__call__ for _missing_ hooks and the standard error message
+        return enum_cls(value)
+
+
 # ===== Default Values =====
 
 # Logging level
@@ -8,23 +8,53 @@ design principles documented in agent-delegation.md.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import random
 import time
-import uuid
+from collections import Counter, deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 from enum import Enum
 
 from orchestrator.config.models import WorkflowConfig
+from orchestrator.agents.base import Agent
 from orchestrator.agents.registry import AgentRegistry
 from orchestrator.agents.loader import AgentLoader
+from orchestrator.logging import get_logger
 from orchestrator.parallel.orchestrator import ParallelOrchestrator
-from orchestrator.utils.constants import LOGGING_LEVEL
+from orchestrator.utils.constants import LOGGING_LEVEL, to_enum
 from orchestrator.notification.manager import NotificationManager, ConsoleNotifier
 from orchestrator.notification.notifier import NotificationType
 
+try:
+    # Optional C serializer for state files (pip install agent-delegate[speedups])
+    import orjson
+except ImportError:  # pragma: no cover – orjson is optional
+    orjson = None
 
-class TaskStatus(str, Enum):
+# Per-task chatter is logged at DEBUG, which the package logging config only
+# enables when LOGGING_LEVEL is DEBUG; disabled calls return before any
+# message formatting
+_logger = get_logger(__name__)
+
+# Seeded from os.urandom at import and again in every forked child (so forked
+# workers don't repeat the parent's sequence); feedback and trace ids only
+# need to be unique, not unpredictable, so they skip the per-call urandom read
+# of uuid4()
+_rng = random.Random()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_rng.seed)
+
+
+def _fast_id() -> str:
+    """Random 128-bit id formatted like ``uuid.uuid4().hex``."""
+    return f"{_rng.getrandbits(128):032x}"
+
+
+class TaskStatus(Enum):
     """Extended task status for feedback loop support."""
     NEW = "NEW"
     IN_PROGRESS = "IN_PROGRESS"
@@ -35,19 +65,41 @@ class TaskStatus(str, Enum):
     DONE = "DONE"
 
 
-# Valid state transitions for feedback loop workflow
-VALID_TRANSITIONS = {
-    TaskStatus.NEW: [TaskStatus.IN_PROGRESS],
-    TaskStatus.IN_PROGRESS: [TaskStatus.IN_REVIEW, TaskStatus.NEEDS_FIXES],
-    TaskStatus.IN_REVIEW: [TaskStatus.APPROVED, TaskStatus.NEEDS_FIXES, TaskStatus.REJECTED],
-    TaskStatus.NEEDS_FIXES: [TaskStatus.IN_PROGRESS, TaskStatus.IN_REVIEW],
-    TaskStatus.APPROVED: [TaskStatus.DONE],
-    TaskStatus.REJECTED: [TaskStatus.DONE],
-    TaskStatus.DONE: []  # Terminal state
-}
+# Valid (from, to) state transitions for the feedback loop workflow; one
+# hash probe per check
+VALID_TRANSITIONS: FrozenSet[Tuple[TaskStatus, TaskStatus]] = frozenset({
+    (TaskStatus.NEW, TaskStatus.IN_PROGRESS),
+    (TaskStatus.IN_PROGRESS, TaskStatus.IN_REVIEW),
+    (TaskStatus.IN_PROGRESS, TaskStatus.NEEDS_FIXES),
+    (TaskStatus.IN_REVIEW, TaskStatus.APPROVED),
+    (TaskStatus.IN_REVIEW, TaskStatus.NEEDS_FIXES),
+    (TaskStatus.IN_REVIEW, TaskStatus.REJECTED),
+    # Approved reviews may complete directly in a single transition
+    (TaskStatus.IN_REVIEW, TaskStatus.DONE),
+    (TaskStatus.NEEDS_FIXES, TaskStatus.IN_PROGRESS),
+    (TaskStatus.NEEDS_FIXES, TaskStatus.IN_REVIEW),
+    (TaskStatus.APPROVED, TaskStatus.DONE),
+    (TaskStatus.REJECTED, TaskStatus.DONE),
+})
+
+# Statuses a task never leaves
+TERMINAL_STATUSES = frozenset({TaskStatus.DONE})
 
 
-class FeedbackSeverity(str, Enum):
+# Score penalty per finding severity when grading quality audit results
+_SEVERITY_PENALTY = {"ERROR": 30, "WARN": 10}
+
+# Minimum score for each feedback outcome, checked in order (REJECTED otherwise)
+_SCORE_THRESHOLDS = ((80, TaskStatus.APPROVED), (50, TaskStatus.NEEDS_FIXES))
+
+# Maximum number of status/feedback history entries kept per task
+MAX_HISTORY_ENTRIES = 64
+
+# Minimum seconds between periodic state saves while a workflow is running
+STATE_SAVE_INTERVAL = 2.0
+
+
+class FeedbackSeverity(Enum):
     """Feedback severity levels."""
     LOW = "low"
     MEDIUM = "medium"
@@ -55,7 +107,7 @@ class FeedbackSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-class FeedbackCategory(str, Enum):
+class FeedbackCategory(Enum):
     """Feedback categories."""
     CODE_QUALITY = "code_quality"
     FUNCTIONAL = "functional"
@@ -63,62 +115,172 @@ class FeedbackCategory(str, Enum):
     DOCUMENTATION = "documentation"
 
 
+@dataclass(frozen=True, slots=True)
+class HistoryEntry:
+    """One recorded status transition; a slotted record is far smaller than a dict."""
+    from_status: TaskStatus
+    to_status: TaskStatus
+    timestamp: float
+    reason: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the ``from``/``to`` dictionary used in state files."""
+        return {
+            "from": self.from_status.value,
+            "to": self.to_status.value,
+            "timestamp": self.timestamp,
+            "reason": self.reason
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HistoryEntry':
+        """Restore an entry saved by ``to_dict``."""
+        return cls(
+            from_status=to_enum(TaskStatus, data["from"]),
+            to_status=to_enum(TaskStatus, data["to"]),
+            timestamp=data["timestamp"],
+            reason=data.get("reason", "")
+        )
+
+
 class TaskState:
     """Task state with feedback loop support."""
     
+    # Serialized fields; together with ``revision`` they form the slots,
+    # which keep per-task memory small
+    _FIELDS = (
+        "task_id",
+        "agent_type",
+        "payload",
+        "status",
+        "status_history",
+        "feedback_history",
+        "status_transitions_total",
+        "retry_count",
+        "created_at",
+        "updated_at",
+        "max_retries",
+        "timeout_at",
+        "dependencies",
+        "dependents",
+        "blocked_by",
+    )
+    __slots__ = _FIELDS + ("revision",)
+    
     def __init__(self, task_id: str, agent_type: str, payload: Dict[str, Any]):
         self.task_id = task_id
         self.agent_type = agent_type
         self.payload = payload
         self.status = TaskStatus.NEW
-        self.status_history = []
-        self.feedback_history = []
+        # Bounded so long-running retries cannot grow memory without limit
+        self.status_history = deque(maxlen=MAX_HISTORY_ENTRIES)
+        self.feedback_history = deque(maxlen=MAX_HISTORY_ENTRIES)
+        self.status_transitions_total = 0
         self.retry_count = 0
         self.created_at = time.time()
         self.updated_at = time.time()
         self.max_retries = 3
         self.timeout_at = self.created_at + 3600  # 1 hour timeout
-        self.dependencies = []  # List of task_ids this task depends on
-        self.dependents = []    # List of task_ids that depend on this task
-        self.blocked_by = []    # List of task_ids currently blocking this task
+        # Sets for O(1) membership; to_dict() emits them as sorted lists
+        self.dependencies = set()  # task_ids this task depends on
+        self.dependents = set()    # task_ids that depend on this task
+        self.blocked_by = set()    # task_ids currently blocking this task
+        # Bumped on every mutation so cached serializations can be reused
+        self.revision = 0
+    
+    def _touch(self, now: Optional[float] = None) -> None:
+        """Record a mutation, optionally at a timestamp the caller already sampled."""
+        self.updated_at = time.time() if now is None else now
+        self.revision += 1
     
-    def add_feedback(self, feedback: Dict[str, Any]) -> None:
+    def add_feedback(self, feedback: Dict[str, Any], now: Optional[float] = None) -> None:
         """Add feedback to this task."""
         self.feedback_history.append(feedback)
-        self.updated_at = time.time()
+        self._touch(now)
     
-    def change_status(self, new_status: TaskStatus, reason: str = "", notifier: Optional[Notifier] = None) -> None:
-        """Change task status and record history with validation."""
-        # Validate state transition
-        if new_status not in VALID_TRANSITIONS.get(self.status, []):
-            raise ValueError(f"Invalid state transition: {self.status} -> {new_status}")
-        
+    def change_status(
+        self,
+        new_status: TaskStatus,
+        reason: str = "",
+        notifier: Optional[Notifier] = None,
+        now: Optional[float] = None
+    ) -> None:
+        """Change task status and record history with validation.
+
+        ``now`` lets callers share one timestamp across related updates.
+        """
         # Prevent transition from terminal state
-        if self.status == TaskStatus.DONE:
+        if self.status in TERMINAL_STATUSES:
             raise ValueError(f"Cannot transition from terminal state: {self.status}")
         
-        self.status_history.append({
-            "from": self.status,
-            "to": new_status,
-            "timestamp": time.time(),
-            "reason": reason
-        })
+        # Validate state transition
+        if (self.status, new_status) not in VALID_TRANSITIONS:
+            raise ValueError(f"Invalid state transition: {self.status} -> {new_status}")
+        
+        if now is None:
+            now = time.time()
+        old_status = self.status
+        self.status_history.append(HistoryEntry(old_status, new_status, now, reason))
         self.status = new_status
-        self.updated_at = time.time()
+        self.status_transitions_total += 1
+        self._touch(now)
         
         # Send status change notification if notifier is provided
         if notifier:
             notifier.send_status_change_notification(
                 task_id=self.task_id,
-                old_status=self.status_history[-1]["from"],
+                old_status=old_status,
                 new_status=new_status,
                 reason=reason
             )
     
-    def increment_retry(self) -> None:
+    def change_status_path(
+        self,
+        path: List[TaskStatus],
+        reason: str = "",
+        notifier: Optional[Notifier] = None,
+        now: Optional[float] = None
+    ) -> None:
+        """Apply several transitions at once, validating the whole path first.
+
+        History gets one entry per step; a notifier receives a single
+        status change covering the whole path.
+        """
+        if not path:
+            raise ValueError("Status path must not be empty")
+        
+        # Prevent transition from terminal state
+        if self.status in TERMINAL_STATUSES:
+            raise ValueError(f"Cannot transition from terminal state: {self.status}")
+        
+        steps = list(zip([self.status, *path], path))
+        for old_status, new_status in steps:
+            if (old_status, new_status) not in VALID_TRANSITIONS:
+                raise ValueError(f"Invalid state transition: {old_status} -> {new_status}")
+        
+        if now is None:
+            now = time.time()
+        self.status_history.extend(
+            HistoryEntry(old_status, new_status, now, reason) for old_status, new_status in steps
+        )
+        first_status = self.status
+        self.status = path[-1]
+        self.status_transitions_total += len(steps)
+        self._touch(now)
+        
+        if notifier:
+            notifier.send_status_change_notification(
+                task_id=self.task_id,
+                old_status=first_status,
+                new_status=self.status,
+                reason=reason,
+                path=[status.value for status in path]
+            )
+    
+    def increment_retry(self, now: Optional[float] = None) -> None:
         """Increment retry count."""
         self.retry_count += 1
-        self.updated_at = time.time()
+        self._touch(now)
     
     def is_timed_out(self) -> bool:
         """Check if task is timed out."""
@@ -131,26 +293,32 @@ class TaskState:
     def add_dependency(self, task_id: str) -> None:
         """Add a dependency to this task."""
         if task_id not in self.dependencies:
-            self.dependencies.append(task_id)
-            self.updated_at = time.time()
+            self.dependencies.add(task_id)
+            self._touch()
     
     def add_dependent(self, task_id: str) -> None:
         """Add a dependent task."""
         if task_id not in self.dependents:
-            self.dependents.append(task_id)
-            self.updated_at = time.time()
+            self.dependents.add(task_id)
+            self._touch()
     
     def add_blocked_by(self, task_id: str) -> None:
         """Add a task that is currently blocking this task."""
         if task_id not in self.blocked_by:
-            self.blocked_by.append(task_id)
-            self.updated_at = time.time()
+            self.blocked_by.add(task_id)
+            self._touch()
     
     def remove_blocked_by(self, task_id: str) -> None:
-        """Remove a task from blocked_by list."""
+        """Remove a task from the blocked_by set."""
         if task_id in self.blocked_by:
-            self.blocked_by.remove(task_id)
-            self.updated_at = time.time()
+            self.blocked_by.discard(task_id)
+            self._touch()
+    
+    def clear_blocked_by(self) -> None:
+        """Remove every task from the blocked_by set."""
+        if self.blocked_by:
+            self.blocked_by.clear()
+            self._touch()
     
     def is_blocked(self) -> bool:
         """Check if this task is currently blocked by other tasks."""
@@ -161,37 +329,99 @@ class TaskState:
         # Task can start if:
         # 1. It's not blocked by other tasks
         # 2. All dependencies are completed (DONE status)
-        return not self.is_blocked() and self.status == TaskStatus.NEW
+        return not self.is_blocked() and self.status is TaskStatus.NEW
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert task state to dictionary."""
-        return {
-            "task_id": self.task_id,
-            "agent_type": self.agent_type,
-            "payload": self.payload,
-            "status": self.status,
-            "status_history": self.status_history,
-            "feedback_history": self.feedback_history,
-            "retry_count": self.retry_count,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "max_retries": self.max_retries,
-            "timeout_at": self.timeout_at,
-            "dependencies": self.dependencies,
-            "dependents": self.dependents,
-            "blocked_by": self.blocked_by
-        }
+        """Convert task state to a JSON-serializable dictionary.
+
+        Enum members (the status and any feedback enums) are emitted as their
+        plain string values.
+        """
+        data = {name: getattr(self, name) for name in self._FIELDS}
+        data["status"] = self.status.value
+        data["status_history"] = [entry.to_dict() for entry in self.status_history]
+        data["feedback_history"] = [
+            {key: value.value if isinstance(value, Enum) else value for key, value in feedback.items()}
+            for feedback in self.feedback_history
+        ]
+        data["dependencies"] = sorted(self.dependencies)
+        data["dependents"] = sorted(self.dependents)
+        data["blocked_by"] = sorted(self.blocked_by)
+        return data
+
+
+class TaskStateEncoder(json.JSONEncoder):
+    """JSON encoder that serializes ``TaskState`` objects in a single pass.
+
+    Lets ``json.dump`` walk task states directly instead of building an
+    intermediate ``to_dict`` copy of every task first.
+    """
+    
+    def default(self, o: Any) -> Any:
+        if isinstance(o, TaskState):
+            return o.to_dict()
+        if isinstance(o, Enum):
+            return o.value
+        return super().default(o)
+
+
+def _encode_state(state_data: Any) -> bytes:
+    """Serialize engine state (or a part of it), pretty-printed only when debug logging is on."""
+    pretty = LOGGING_LEVEL == "DEBUG"
+    if orjson is not None:
+        # Non-str keys (e.g. integer YAML keys in payloads) become strings,
+        # as they do with the stdlib encoder
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(state_data, default=TaskStateEncoder().default, option=option)
+    return json.dumps(state_data, indent=2 if pretty else None, cls=TaskStateEncoder).encode("utf-8")
+
+
+def _decode_state(raw: bytes) -> Dict[str, Any]:
+    """Parse a state file; raises ``json.JSONDecodeError`` on malformed input."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class FeedbackLoopWorkflowEngine:
     """Workflow engine with feedback loop support."""
     
-    def __init__(self, state_file: Optional[str] = None):
+    def __init__(
+        self,
+        state_file: Optional[str] = None,
+        include_task_states_in_response: bool = False,
+        max_parallel_tasks: int = 4
+    ):
         self.task_states: Dict[str, TaskState] = {}
-        self.parallel_orchestrator = ParallelOrchestrator(agent_registry=AgentRegistry())
+        # Full per-task dumps are opt-in; by default responses only list task ids
+        self.include_task_states_in_response = include_task_states_in_response
+        # Running per-status task counts, kept in sync on every transition
+        self._status_counts: Counter[TaskStatus] = Counter()
+        # Agent runs are capped by the orchestrator's worker pool; task drivers
+        # only await their runs, so they need no limit of their own
+        self.parallel_orchestrator = ParallelOrchestrator(
+            max_workers=max_parallel_tasks, agent_registry=AgentRegistry()
+        )
         self.agent_loader = AgentLoader()
         self.state_file = state_file
         
+        # Quality auditor is loaded once and reused for every feedback round
+        self._quality_auditor: Optional[Agent] = None
+        self._quality_auditor_missing = False
+        
+        # Latest orchestrator run id per task (changes when a task is resubmitted)
+        self._run_ids: Dict[str, str] = {}
+        
+        # Task driver bookkeeping for run_workflow_async
+        self._drivers_changed: Optional[asyncio.Condition] = None
+        self._active_drivers = 0
+        
+        # Monotonic time of the last state save, for debouncing periodic saves
+        self._last_save = float("-inf")
+        # Encoded JSON per task, keyed by the TaskState revision it was built from
+        self._state_fragments: Dict[str, Tuple[int, bytes]] = {}
+        
         # Initialize notification system
         self.notification_manager = NotificationManager()
         self.notifier = ConsoleNotifier(self.notification_manager)
@@ -200,28 +430,65 @@ class FeedbackLoopWorkflowEngine:
         if state_file:
             self.load_state()
     
-    def _log(self, message: str, *, level: str = "INFO") -> None:
-        """Simple logger."""
-        if LOGGING_LEVEL == "DEBUG" or level != "DEBUG":
-            print(f"[{level}] {message}")
-    
     def save_state(self) -> None:
-        """Save current task states to file."""
+        """Save current task states to file.
+
+        Writes to a temporary file and renames it over the state file, so a
+        crash mid-write never leaves a truncated state file behind.
+        """
         if not self.state_file:
             return
         
+        tmp_file = f"{self.state_file}.tmp"
         try:
-            state_data = {
-                "task_states": {tid: ts.to_dict() for tid, ts in self.task_states.items()},
-                "timestamp": time.time()
-            }
+            if LOGGING_LEVEL == "DEBUG":
+                # Pretty-printed output can't be spliced from cached fragments
+                data = _encode_state({"task_states": self.task_states, "timestamp": time.time()})
+            else:
+                data = b"".join((
+                    b'{"task_states":', self._encode_task_states(),
+                    b',"timestamp":', _encode_state(time.time()), b"}"
+                ))
             
-            with open(self.state_file, "w") as f:
-                json.dump(state_data, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
+            self._last_save = time.monotonic()
             
-            self._log(f"State saved to {self.state_file}")
+            _logger.debug("State saved to %s", self.state_file)
         except Exception as e:
-            self._log(f"Failed to save state: {e}", level="ERROR")
+            _logger.error("Failed to save state: %s", e)
+    
+    def _encode_task_states(self) -> bytes:
+        """Encode ``task_states`` as a compact JSON object.
+
+        Only tasks mutated since the previous save are re-serialized; the rest
+        reuse their cached fragment. Every change to a serialized field must go
+        through a ``TaskState`` mutator so the revision is bumped.
+        """
+        # Drop fragments of tasks that are no longer tracked
+        for task_id in self._state_fragments.keys() - self.task_states.keys():
+            del self._state_fragments[task_id]
+        
+        parts = []
+        for task_id, task_state in self.task_states.items():
+            cached = self._state_fragments.get(task_id)
+            if cached is None or cached[0] != task_state.revision:
+                cached = (task_state.revision, _encode_state(task_state))
+                self._state_fragments[task_id] = cached
+            parts.append(_encode_state(task_id) + b":" + cached[1])
+        return b"{" + b",".join(parts) + b"}"
+    
+    def _request_save(self) -> None:
+        """Save state unless the last save was less than ``STATE_SAVE_INTERVAL`` ago.
+
+        Skipped saves are covered by the next periodic save or the final save
+        at the end of the run.
+        """
+        if self.state_file and time.monotonic() - self._last_save >= STATE_SAVE_INTERVAL:
+            self.save_state()
     
     def load_state(self) -> None:
         """Load task states from file."""
@@ -230,8 +497,8 @@ class FeedbackLoopWorkflowEngine:
         
         try:
             if Path(self.state_file).exists():
-                with open(self.state_file, "r") as f:
-                    state_data = json.load(f)
+                with open(self.state_file, "rb") as f:
+                    state_data = _decode_state(f.read())
                 
                 # Restore task states
                 for tid, ts_data in state_data.get("task_states", {}).items():
@@ -242,23 +509,34 @@ class FeedbackLoopWorkflowEngine:
                     )
                     
                     # Restore all attributes
-                    task_state.status = TaskStatus(ts_data["status"])
-                    task_state.status_history = ts_data["status_history"]
-                    task_state.feedback_history = ts_data["feedback_history"]
+                    task_state.status = to_enum(TaskStatus, ts_data["status"])
+                    task_state.status_history.extend(
+                        HistoryEntry.from_dict(entry) for entry in ts_data["status_history"]
+                    )
+                    task_state.feedback_history.extend(ts_data["feedback_history"])
+                    task_state.status_transitions_total = ts_data.get(
+                        "status_transitions_total", len(ts_data["status_history"])
+                    )
                     task_state.retry_count = ts_data["retry_count"]
                     task_state.created_at = ts_data["created_at"]
                     task_state.updated_at = ts_data["updated_at"]
                     task_state.max_retries = ts_data["max_retries"]
                     task_state.timeout_at = ts_data["timeout_at"]
-                    task_state.dependencies = ts_data.get("dependencies", [])
-                    task_state.dependents = ts_data.get("dependents", [])
-                    task_state.blocked_by = ts_data.get("blocked_by", [])
+                    task_state.dependencies = set(ts_data.get("dependencies", []))
+                    task_state.dependents = set(ts_data.get("dependents", []))
+                    task_state.blocked_by = set(ts_data.get("blocked_by", []))
                     
                     self.task_states[tid] = task_state
+                    self._status_counts[task_state.status] += 1
                 
-                self._log(f"State loaded from {self.state_file}")
+                _logger.info("State loaded from %s", self.state_file)
+        except json.JSONDecodeError as e:
+            # Keep the unreadable file for inspection and start from a clean state
+            corrupt_file = f"{self.state_file}.corrupt"
+            os.replace(self.state_file, corrupt_file)
+            _logger.error("Corrupt state file moved to %s: %s", corrupt_file, e)
         except Exception as e:
-            self._log(f"Failed to load state: {e}", level="ERROR")
+            _logger.error("Failed to load state: %s", e)
     
     def submit_task(self, agent_type: str, payload: Dict[str, Any]) -> str:
         """Submit a new task to the workflow engine."""
@@ -271,6 +549,8 @@ class FeedbackLoopWorkflowEngine:
         # Create task state with the same task_id
         task_state = TaskState(task_id, agent_type, payload)
         self.task_states[task_id] = task_state
+        self._status_counts[task_state.status] += 1
+        self._track_run(task_id, task_id)
         
         # Set up dependencies from payload if provided
         if "dependencies" in payload:
@@ -280,31 +560,42 @@ class FeedbackLoopWorkflowEngine:
                 if dep_id in self.task_states:
                     self.task_states[dep_id].add_dependent(task_id)
         
-        # Resolve dependencies before starting
-        self._resolve_dependencies(task_id)
+        # Resolve dependencies before starting (most tasks have none)
+        if task_state.dependencies:
+            self._resolve_dependencies(task_id)
         
         # Change status to IN_PROGRESS if not blocked
         if task_state.can_start():
             self.change_task_status(task_id, TaskStatus.IN_PROGRESS, "Task submitted and ready to start")
         else:
-            self._log(f"Task {task_id} is blocked by dependencies: {task_state.blocked_by}")
+            _logger.info("Task %s is blocked by dependencies: %s", task_id, task_state.blocked_by)
         
-        self._log(f"Task submitted: {task_id} (agent: {agent_type})")
+        _logger.debug("Task submitted: %s (agent: %s)", task_id, agent_type)
         return task_id
     
+    def get_task_state(self, task_id: str) -> Optional[TaskState]:
+        """Get the state of a task, or ``None`` if it is unknown."""
+        return self.task_states.get(task_id)
+    
+    def _track_run(self, task_id: str, run_id: str) -> None:
+        """Record the orchestrator run whose result the task is waiting for."""
+        self._run_ids[task_id] = run_id
+    
     def _resolve_dependencies(self, task_id: str) -> None:
         """Resolve dependencies for a task and update blocking status."""
         if task_id not in self.task_states:
             return
             
         task_state = self.task_states[task_id]
+        if not task_state.dependencies:
+            return
         
         # Check if all dependencies are completed
         all_dependencies_completed = True
         for dep_id in task_state.dependencies:
             if dep_id in self.task_states:
                 dep_state = self.task_states[dep_id]
-                if dep_state.status != TaskStatus.DONE:
+                if dep_state.status is not TaskStatus.DONE:
                     all_dependencies_completed = False
                     task_state.add_blocked_by(dep_id)
             else:
@@ -314,12 +605,16 @@ class FeedbackLoopWorkflowEngine:
         
         # If all dependencies are completed, remove blocking
         if all_dependencies_completed:
-            task_state.blocked_by = []
-        
-        self._log(f"Dependency resolution for {task_id}: blocked_by={task_state.blocked_by}")
+            task_state.clear_blocked_by()
+        else:
+            _logger.debug("Dependency resolution for %s: blocked_by=%s", task_id, task_state.blocked_by)
     
     def _update_dependents(self, task_id: str) -> None:
-        """Update dependents when a task status changes."""
+        """Unblock dependents of a task that just reached DONE.
+
+        DONE is terminal, so only the finished task needs to leave each direct
+        dependent's ``blocked_by``; the dependent is ready once that is empty.
+        """
         if task_id not in self.task_states:
             return
             
@@ -327,49 +622,97 @@ class FeedbackLoopWorkflowEngine:
         
         # Update all dependents
         for dep_id in task_state.dependents:
-            if dep_id in self.task_states:
-                self._resolve_dependencies(dep_id)
+            dependent = self.task_states.get(dep_id)
+            if dependent is not None:
+                dependent.remove_blocked_by(task_id)
     
-    def change_task_status(self, task_id: str, new_status: TaskStatus, reason: str = "") -> None:
-        """Change task status and update dependents."""
+    def change_task_status(
+        self, task_id: str, new_status: TaskStatus, reason: str = "", now: Optional[float] = None
+    ) -> None:
+        """Change task status and update dependents.
+
+        The history entry, ``updated_at`` and notification payloads share one
+        timestamp: ``now`` if given, else a single fresh sample.
+        """
         if task_id not in self.task_states:
             raise ValueError(f"Task not found: {task_id}")
         
         task_state = self.task_states[task_id]
         old_status = task_state.status
+        if now is None:
+            now = time.time()
         
         # Change status with notification
-        task_state.change_status(new_status, reason, self.notifier)
+        task_state.change_status(new_status, reason, self.notifier, now)
+        self._count_transition(old_status, new_status)
         
         # Send specific notifications based on status change
-        self._send_status_specific_notifications(task_state, old_status, new_status, reason)
+        self._send_status_specific_notifications(task_state, old_status, new_status, reason, now)
         
         # Update dependents if status changed to DONE
-        if new_status == TaskStatus.DONE and old_status != TaskStatus.DONE:
+        if new_status is TaskStatus.DONE and old_status is not TaskStatus.DONE:
             self._update_dependents(task_id)
     
+    def _batch_transition(
+        self, task_id: str, path: List[TaskStatus], reason: str = "", now: Optional[float] = None
+    ) -> None:
+        """Move a task through several statuses with one validated change.
+
+        Only the final step gets status-specific notifications.
+        """
+        if task_id not in self.task_states:
+            raise ValueError(f"Task not found: {task_id}")
+        
+        task_state = self.task_states[task_id]
+        old_status = task_state.status
+        if now is None:
+            now = time.time()
+        task_state.change_status_path(path, reason, self.notifier, now)
+        self._count_transition(old_status, task_state.status)
+        
+        before_last = path[-2] if len(path) > 1 else old_status
+        self._send_status_specific_notifications(task_state, before_last, task_state.status, reason, now)
+        
+        if task_state.status is TaskStatus.DONE:
+            self._update_dependents(task_id)
+    
+    def _count_transition(self, old_status: TaskStatus, new_status: TaskStatus) -> None:
+        """Move one task between the running status counts."""
+        self._status_counts[old_status] -= 1
+        self._status_counts[new_status] += 1
+    
+    def status_counts(self) -> Dict[str, int]:
+        """Get the number of tasks in each status."""
+        return {status.value: count for status, count in self._status_counts.items() if count}
+    
     def _send_status_specific_notifications(
         self, 
         task_state: TaskState, 
         old_status: TaskStatus, 
         new_status: TaskStatus, 
-        reason: str
+        reason: str,
+        now: Optional[float] = None
     ) -> None:
         """Send specific notifications based on status transitions."""
-        # Approval completed notification
-        if new_status == TaskStatus.APPROVED:
+        if now is None:
+            now = time.time()
+        
+        # Approval completed notification (approved reviews may go straight to DONE)
+        if new_status is TaskStatus.APPROVED or (
+            new_status is TaskStatus.DONE and old_status is TaskStatus.IN_REVIEW
+        ):
             self.notifier.send_approval_completed_notification(
                 task_id=task_state.task_id,
                 approval_details={
                     "task_id": task_state.task_id,
                     "agent_type": task_state.agent_type,
                     "reason": reason,
-                    "timestamp": time.time()
+                    "timestamp": now
                 }
             )
         
         # Fix request notification
-        elif new_status == TaskStatus.NEEDS_FIXES:
+        elif new_status is TaskStatus.NEEDS_FIXES:
             self.notifier.send_fix_request_notification(
                 task_id=task_state.task_id,
                 fix_details={
@@ -377,76 +720,108 @@ class FeedbackLoopWorkflowEngine:
                     "agent_type": task_state.agent_type,
                     "reason": reason,
                     "retry_count": task_state.retry_count,
-                    "timestamp": time.time()
+                    "timestamp": now
                 }
             )
         
         # Feedback request notification when moving to IN_REVIEW
-        elif new_status == TaskStatus.IN_REVIEW:
+        elif new_status is TaskStatus.IN_REVIEW:
             self.notifier.send_feedback_request_notification(
                 task_id=task_state.task_id,
                 feedback_details={
                     "task_id": task_state.task_id,
                     "agent_type": task_state.agent_type,
                     "from_status": old_status,
-                    "timestamp": time.time()
+                    "timestamp": now
                 }
             )
     
+    def _get_quality_auditor(self) -> Optional[Agent]:
+        """Load the quality auditor once; ``None`` when it is not registered."""
+        if self._quality_auditor is None and not self._quality_auditor_missing:
+            try:
+                self._quality_auditor = self.agent_loader.load_agent("quality_auditor")
+            except KeyError:
+                # Quality auditor not found, fallback to auto-approve from now on
+                self._quality_auditor_missing = True
+                _logger.warning("Quality auditor agent not found, using auto-approval")
+        return self._quality_auditor
+    
+    def _audit_context(self, task_id: str, agent_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the quality auditor's input; the task state is snapshotted here."""
+        return {
+            "task_id": task_id,
+            "results": agent_results,
+            "task_state": self.task_states[task_id].to_dict()
+        }
+    
     def _generate_feedback(self, task_id: str, agent_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate feedback for a completed task."""
-        # Use quality auditor agent to generate feedback
+        auditor = self._get_quality_auditor()
+        if auditor is None:
+            return self._auto_approve(task_id)
+        
         try:
-            quality_auditor = self.agent_loader.load_agent("quality_auditor")
-            context = {
-                "task_id": task_id,
-                "results": agent_results,
-                "task_state": self.task_states[task_id].to_dict()
-            }
-            
-            feedback_result = quality_auditor.run(context)
-            if feedback_result and "findings" in feedback_result:
-                # Convert to our feedback format
-                findings = feedback_result["findings"]
-                
-                # Calculate overall score based on findings
-                total_score = 100
-                for finding in findings:
-                    if finding.get("severity") == "ERROR":
-                        total_score -= 30
-                    elif finding.get("severity") == "WARN":
-                        total_score -= 10
-                
-                # Determine status based on score
-                if total_score >= 80:
-                    status = TaskStatus.APPROVED
-                elif total_score >= 50:
-                    status = TaskStatus.NEEDS_FIXES
-                else:
-                    status = TaskStatus.REJECTED
-                
-                feedback = {
-                    "feedback_id": str(uuid.uuid4()),
-                    "task_id": task_id,
-                    "status": status,
-                    "severity": "medium" if total_score >= 50 else "high",
-                    "findings": findings,
-                    "overall_score": total_score,
-                    "recommendation": feedback_result.get("recommendation", "Review and fix issues"),
-                    "reviewer": "quality_auditor",
-                    "timestamp": time.time()
-                }
-                
-                return feedback
-        except KeyError:
-            # Quality auditor not found, fallback to auto-approve
-            self._log("Quality auditor agent not found, using auto-approval", level="WARNING")
+            feedback_result = auditor.run(self._audit_context(task_id, agent_results))
+            return self._feedback_from_audit(task_id, feedback_result)
         except Exception as e:
-            self._log(f"Feedback generation error: {e}", level="ERROR")
+            _logger.error("Feedback generation error: %s", e)
+            return self._auto_approve(task_id)
+    
+    async def _generate_feedback_async(self, task_id: str, agent_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate feedback with the audit itself running in a worker thread.
+
+        The context is built on the event loop, so the worker never reads
+        task state that other drivers may be updating.
+        """
+        auditor = self._get_quality_auditor()
+        if auditor is None:
+            return self._auto_approve(task_id)
         
-        # Fallback: Auto-approve if no quality auditor or error occurred
+        context = self._audit_context(task_id, agent_results)
+        try:
+            loop = asyncio.get_running_loop()
+            feedback_result = await loop.run_in_executor(None, auditor.run, context)
+            return self._feedback_from_audit(task_id, feedback_result)
+        except Exception as e:
+            _logger.error("Feedback generation error: %s", e)
+            return self._auto_approve(task_id)
+    
+    def _feedback_from_audit(self, task_id: str, feedback_result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert a quality audit result into feedback."""
+        if not feedback_result or "findings" not in feedback_result:
+            # Auto-approve if the audit produced no findings
+            return self._auto_approve(task_id)
+        
+        findings = feedback_result["findings"]
+        
+        # Calculate overall score based on findings
+        total_score = 100 - sum(
+            _SEVERITY_PENALTY.get(finding.get("severity"), 0) for finding in findings
+        )
+        
+        # Determine status based on score
+        status = next(
+            (status for threshold, status in _SCORE_THRESHOLDS if total_score >= threshold),
+            TaskStatus.REJECTED
+        )
+        
+        return {
+            "feedback_id": _fast_id(),
+            "task_id": task_id,
+            "status": status,
+            "severity": "medium" if total_score >= 50 else "high",
+            "findings": findings,
+            "overall_score": total_score,
+            "recommendation": feedback_result.get("recommendation", "Review and fix issues"),
+            "reviewer": "quality_auditor",
+            "timestamp": time.time()
+        }
+    
+    def _auto_approve(self, task_id: str) -> Dict[str, Any]:
+        """Build auto-approval feedback used when no quality audit is available."""
         return {
-            "feedback_id": str(uuid.uuid4()),
+            "feedback_id": _fast_id(),
             "task_id": task_id,
             "status": TaskStatus.APPROVED,
             "severity": "low",
@@ -459,67 +834,87 @@ class FeedbackLoopWorkflowEngine:
     
     def process_feedback_loop(self, task_id: str) -> bool:
         """Process feedback loop for a completed task."""
-        if task_id not in self.task_states:
-            self._log(f"Task not found: {task_id}", level="ERROR")
+        result = self._latest_result(task_id)
+        if result is None:
             return False
+        return self._apply_feedback(task_id, self._generate_feedback(task_id, result))
+    
+    async def process_feedback_loop_async(self, task_id: str) -> bool:
+        """Process feedback loop for a completed task without blocking the event loop."""
+        result = self._latest_result(task_id)
+        if result is None:
+            return False
+        return self._apply_feedback(task_id, await self._generate_feedback_async(task_id, result))
+    
+    def _latest_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get the result of the task's latest orchestrator run, logging why if there is none."""
+        if task_id not in self.task_states:
+            _logger.error("Task not found: %s", task_id)
+            return None
         
-        task_state = self.task_states[task_id]
-        
-        # Get task result from parallel orchestrator
-        result = self.parallel_orchestrator.get_task_result(task_id)
+        result = self.parallel_orchestrator.get_task_result(self._run_ids.get(task_id, task_id))
         
         if not result:
-            self._log(f"No result found for task: {task_id}", level="WARNING")
-            return False
+            _logger.warning("No result found for task: %s", task_id)
+            return None
+        return result
+    
+    def _apply_feedback(self, task_id: str, feedback: Dict[str, Any]) -> bool:
+        """Record feedback and move the task accordingly; ``True`` once it is done."""
+        task_state = self.task_states[task_id]
         
-        # Generate feedback
-        feedback = self._generate_feedback(task_id, result)
+        # One timestamp for every update this feedback round makes
+        now = time.time()
         
         # Add feedback to task state
-        task_state.add_feedback(feedback)
+        task_state.add_feedback(feedback, now)
         
         # Handle feedback based on current task status
         current_status = task_state.status
         
-        if current_status == TaskStatus.IN_PROGRESS:
+        if current_status is TaskStatus.IN_PROGRESS:
             # From IN_PROGRESS, we can only go to IN_REVIEW or NEEDS_FIXES
-            if feedback["status"] == TaskStatus.APPROVED:
+            if feedback["status"] is TaskStatus.APPROVED:
                 # If feedback says approved, transition to IN_REVIEW first
                 new_status = TaskStatus.IN_REVIEW
-                self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}")
-            elif feedback["status"] == TaskStatus.NEEDS_FIXES:
+                self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}", now)
+            elif feedback["status"] is TaskStatus.NEEDS_FIXES:
                 new_status = TaskStatus.NEEDS_FIXES
-                self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}")
+                self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}", now)
             else:
                 # For REJECTED or other statuses, go to IN_REVIEW for final decision
                 new_status = TaskStatus.IN_REVIEW
-                self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}")
-        elif current_status == TaskStatus.IN_REVIEW:
-            # From IN_REVIEW, we can go to APPROVED, NEEDS_FIXES, or REJECTED
+                self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}", now)
+        elif current_status is TaskStatus.IN_REVIEW:
+            # From IN_REVIEW, approval completes the task directly; otherwise
+            # we go to NEEDS_FIXES or REJECTED
             new_status = feedback["status"]
-            self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}")
+            if new_status is TaskStatus.APPROVED:
+                self.change_task_status(task_id, TaskStatus.DONE, f"Approved: {feedback['recommendation']}", now)
+                _logger.debug("Task %s approved and completed", task_id)
+                return True
+            self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}", now)
         else:
             # For other statuses, use the feedback status directly
             new_status = feedback["status"]
-            self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}")
+            if new_status is TaskStatus.APPROVED:
+                self._batch_transition(task_id, [TaskStatus.APPROVED, TaskStatus.DONE], "Task approved and completed", now)
+                _logger.debug("Task %s approved and completed", task_id)
+                return True
+            self.change_task_status(task_id, new_status, f"Feedback: {feedback['recommendation']}", now)
         
-        self._log(f"Task {task_id} status changed to {new_status}")
+        _logger.debug("Task %s status changed to %s", task_id, new_status)
         
         # Handle different statuses
-        if new_status == TaskStatus.APPROVED:
-            self.change_task_status(task_id, TaskStatus.DONE, "Task approved and completed")
-            return True
-        elif new_status == TaskStatus.NEEDS_FIXES:
+        if new_status is TaskStatus.NEEDS_FIXES:
             if task_state.has_reached_max_retries():
-                # From NEEDS_FIXES, we need to go through IN_REVIEW to get to REJECTED
-                self.change_task_status(task_id, TaskStatus.IN_REVIEW, "Max retries reached, moving to review for final decision")
-                # Then immediately transition to REJECTED from IN_REVIEW
-                self.change_task_status(task_id, TaskStatus.REJECTED, "Max retries reached")
+                # From NEEDS_FIXES, REJECTED is only reachable through IN_REVIEW
+                self._batch_transition(task_id, [TaskStatus.IN_REVIEW, TaskStatus.REJECTED], "Max retries reached", now)
                 return False
             else:
                 # Resubmit task for fixes
-                task_state.increment_retry()
-                self.parallel_orchestrator.submit_task(
+                task_state.increment_retry(now)
+                run_id = self.parallel_orchestrator.submit_task(
                     agent_type=task_state.agent_type,
                     payload={
                         **task_state.payload,
@@ -527,9 +922,11 @@ class FeedbackLoopWorkflowEngine:
                         "retry_count": task_state.retry_count
                     }
                 )
-                task_state.change_status(TaskStatus.IN_PROGRESS, "Resubmitted for fixes")
+                self._track_run(task_id, run_id)
+                task_state.change_status(TaskStatus.IN_PROGRESS, "Resubmitted for fixes", now=now)
+                self._count_transition(TaskStatus.NEEDS_FIXES, TaskStatus.IN_PROGRESS)
                 return False
-        elif new_status == TaskStatus.REJECTED:
+        elif new_status is TaskStatus.REJECTED:
             return False
         else:
             # For IN_REVIEW status, we need to wait for final approval
@@ -537,72 +934,114 @@ class FeedbackLoopWorkflowEngine:
         
         return True
     
+    async def _wait_until_startable(self, task_state: TaskState) -> bool:
+        """Park a driver until its task's dependencies are resolved.
+
+        Returns ``False`` when every other driver has finished or is parked too,
+        i.e. the dependencies can no longer be resolved.
+        """
+        async with self._drivers_changed:
+            self._active_drivers -= 1
+            self._drivers_changed.notify_all()
+            await self._drivers_changed.wait_for(
+                lambda: task_state.can_start() or self._active_drivers == 0
+            )
+            if not task_state.can_start():
+                return False
+            self._active_drivers += 1
+            return True
+    
+    async def _drive_task(self, task_id: str) -> None:
+        """Drive a task through its orchestrator runs and feedback loop."""
+        task_state = self.task_states[task_id]
+        active = True
+        try:
+            while True:
+                run_id = self._run_ids.get(task_id, task_id)
+                future = self.parallel_orchestrator.get_task_future(run_id)
+                if future is None:
+                    return
+                
+                # Sleep until the run finishes or the task times out
+                run = asyncio.wrap_future(future)
+                done, _ = await asyncio.wait(
+                    {run},
+                    timeout=max(0.0, task_state.timeout_at - time.time())
+                )
+                if not done:
+                    _logger.warning("Timed out waiting for task: %s", task_id)
+                    return
+                if not run.cancelled():
+                    # Failed runs are reported by the feedback loop as a missing result
+                    run.exception()
+                
+                if task_state.status is TaskStatus.NEW:
+                    # Finished early, but dependencies are not DONE yet; the
+                    # wait releases this driver's slot, so a cancellation while
+                    # parked must not release it again
+                    active = False
+                    active = await self._wait_until_startable(task_state)
+                    if not active:
+                        _logger.warning("Task %s is still blocked by dependencies: %s", task_id, task_state.blocked_by)
+                        return
+                    self.change_task_status(task_id, TaskStatus.IN_PROGRESS, "Task dependencies resolved, starting now")
+                    _logger.info("Task started after dependency resolution: %s", task_id)
+                
+                if task_state.status not in (TaskStatus.IN_PROGRESS, TaskStatus.NEEDS_FIXES):
+                    return
+                
+                completed = await self.process_feedback_loop_async(task_id)
+                
+                # Save state periodically
+                self._request_save()
+                
+                if completed:
+                    _logger.info("Task completed: %s", task_id)
+                    return
+                
+                _logger.debug("Task needs fixes: %s", task_id)
+                if self._run_ids.get(task_id) == run_id:
+                    # Not resubmitted, nothing more to wait for
+                    return
+        finally:
+            if active:
+                async with self._drivers_changed:
+                    self._active_drivers -= 1
+                    self._drivers_changed.notify_all()
+    
     def run_workflow(self, config: WorkflowConfig) -> Dict[str, Any]:
         """Run workflow with feedback loop support."""
+        return asyncio.run(self.run_workflow_async(config))
+    
+    async def run_workflow_async(self, config: WorkflowConfig) -> Dict[str, Any]:
+        """Run workflow with feedback loop support on the current event loop."""
         start_time = time.time()
-        completed_tasks = []
         
-        # Submit all tasks
-        for stage in config.workflow.stages:
-            for agent in stage.agents:
-                task_id = self.submit_task(
-                    agent_type=agent,
-                    payload={
-                        "stage": stage.name,
-                        "config": config.dict(),
-                        "workflow": config.workflow.dict()
-                    }
-                )
+        # Submit all tasks. The config snapshots are dumped once and shared by
+        # every payload, so agents must treat payload["config"] and
+        # payload["workflow"] as read-only.
+        config_dict = config.dict()
+        workflow_dict = config.workflow.dict()
+        submissions = [
+            (stage.name, agent)
+            for stage in config.workflow.stages
+            for agent in stage.agents
+        ]
+        for stage_name, agent in submissions:
+            self.submit_task(
+                agent_type=agent,
+                payload={
+                    "stage": stage_name,
+                    "config": config_dict,
+                    "workflow": workflow_dict
+                }
+            )
         
-        # Process feedback loops
+        # Drive every task's feedback loop concurrently
         all_tasks = list(self.task_states.keys())
-        remaining_tasks = all_tasks.copy()
-        max_iterations = 100  # Prevent infinite loops
-        iteration = 0
-        
-        while remaining_tasks and iteration < max_iterations:
-            iteration += 1
-            # Check each task
-            new_remaining_tasks = []
-            
-            for task_id in remaining_tasks:
-                task_state = self.task_states[task_id]
-                
-                # Check if task is completed in parallel orchestrator
-                result = self.parallel_orchestrator.get_task_result(task_id)
-                
-                if result and task_state.status in [TaskStatus.IN_PROGRESS, TaskStatus.NEEDS_FIXES]:
-                    # Process feedback loop
-                    completed = self.process_feedback_loop(task_id)
-                    
-                    if completed:
-                        completed_tasks.append(task_id)
-                        self._log(f"Task completed: {task_id}")
-                    else:
-                        # Task needs more work
-                        new_remaining_tasks.append(task_id)
-                        self._log(f"Task needs fixes: {task_id}")
-                elif task_state.status == TaskStatus.NEW and task_state.can_start():
-                    # Start blocked tasks that are now ready
-                    self.change_task_status(task_id, TaskStatus.IN_PROGRESS, "Task dependencies resolved, starting now")
-                    new_remaining_tasks.append(task_id)
-                    self._log(f"Task started after dependency resolution: {task_id}")
-                else:
-                    # Task still in progress or blocked
-                    new_remaining_tasks.append(task_id)
-            
-            remaining_tasks = new_remaining_tasks
-            
-            # Add some delay to allow tasks to complete
-            if remaining_tasks:
-                time.sleep(1.0)
-            
-            # Save state periodically
-            if self.state_file and iteration % 10 == 0:
-                self.save_state()
-        
-        if iteration >= max_iterations and remaining_tasks:
-            self._log(f"Max iterations reached, {len(remaining_tasks)} tasks still pending", level="WARNING")
+        self._drivers_changed = asyncio.Condition()
+        self._active_drivers = len(all_tasks)
+        await asyncio.gather(*(self._drive_task(task_id) for task_id in all_tasks))
         
         # Save final state
         if self.state_file:
@@ -612,6 +1051,7 @@ class FeedbackLoopWorkflowEngine:
         self.parallel_orchestrator.shutdown()
         
         execution_time = time.time() - start_time
+        unread = self.notification_manager.get_unread_counts()
         
         # Build response
         response = {
@@ -620,7 +1060,7 @@ class FeedbackLoopWorkflowEngine:
             "findings": [
                 {
                     "severity": "INFO",
-                    "message": f"Completed {len(completed_tasks)} tasks with feedback loops",
+                    "message": f"Completed {self._status_counts[TaskStatus.DONE]} tasks with feedback loops",
                     "ref": "feedback_loop_execution"
                 }
             ],
@@ -628,59 +1068,67 @@ class FeedbackLoopWorkflowEngine:
             "next_actions": [],
             "context": {
                 "feedback_loop_enabled": True,
-                "completed_tasks": len(completed_tasks),
+                "completed_tasks": self._status_counts[TaskStatus.DONE],
+                "status_counts": self.status_counts(),
                 "total_tasks": len(all_tasks),
                 "execution_time_ms": int(execution_time * 1000),
-                "task_states": {tid: ts.to_dict() for tid, ts in self.task_states.items()},
+                "task_ids": all_tasks,
                 "notifications": {
                     "total_notifications": len(self.notification_manager.get_notifications()),
-                    "unread_count": self.notification_manager.get_unread_count(),
+                    "unread_count": sum(unread.values()),
                     "notification_types": {
-                        "status_change": self.notification_manager.get_unread_count(NotificationType.STATUS_CHANGE),
-                        "feedback_request": self.notification_manager.get_unread_count(NotificationType.FEEDBACK_REQUEST),
-                        "approval_completed": self.notification_manager.get_unread_count(NotificationType.APPROVAL_COMPLETED),
-                        "fix_request": self.notification_manager.get_unread_count(NotificationType.FIX_REQUEST),
-                        "error": self.notification_manager.get_unread_count(NotificationType.ERROR)
+                        "status_change": unread[NotificationType.STATUS_CHANGE],
+                        "feedback_request": unread[NotificationType.FEEDBACK_REQUEST],
+                        "approval_completed": unread[NotificationType.APPROVAL_COMPLETED],
+                        "fix_request": unread[NotificationType.FIX_REQUEST],
+                        "error": unread[NotificationType.ERROR]
                     }
                 }
             },
-            "trace_id": str(uuid.uuid4()),
+            "trace_id": _fast_id(),
             "execution_time_ms": int(execution_time * 1000),
         }
         
+        if self.include_task_states_in_response:
+            # Serialized lazily by TaskStateEncoder
+            response["context"]["task_states"] = dict(self.task_states)
+        elif self.state_file:
+            # Full states were just saved; point callers there instead
+            response["context"]["state_file"] = str(self.state_file)
+        
         return response
 
 
-def run_workflow_with_feedback(config_path: str) -> Dict[str, Any]:
-    """Run workflow with feedback loop support."""
-    from orchestrator.config.loader import ConfigLoader
-    from orchestrator.config.validator import ConfigValidator
+def run_workflow_with_feedback(config: Union[str, Path, WorkflowConfig]) -> Dict[str, Any]:
+    """Run workflow with feedback loop support.
+
+    Accepts either a workflow file path, which is loaded and validated here
+    (cached until the file changes), or an already validated ``WorkflowConfig``.
+    """
+    if isinstance(config, WorkflowConfig):
+        return _run_feedback_engine(config)
     
-    # Load and validate workflow
-    workflow_path = Path(config_path)
-    loader = ConfigLoader()
-    validator = ConfigValidator()
+    from pydantic import ValidationError
+    from orchestrator.config.loader import load_validated_workflow
     
-    # Load raw YAML for schema validation
-    raw_docs = loader._load_yaml_file(workflow_path)
-    workflow_dict = raw_docs[0] if isinstance(raw_docs, list) else raw_docs
+    # Load and validate workflow; file and YAML errors propagate
+    try:
+        workflow_config, errors = load_validated_workflow(config)
+    except ValidationError as exc:
+        print(f"Pydantic validation error: {exc}")
+        return {"status": "ERROR", "message": str(exc)}
     
-    # Validate
-    is_valid, errors = validator.validate_workflow(workflow_dict)
-    if not is_valid:
+    if workflow_config is None:
         print("Workflow validation failed:")
         for err in errors:
             print(f"  - {err}")
         return {"status": "ERROR", "message": "Validation failed"}
     
-    # Load config
-    try:
-        config = loader.load_workflow(workflow_path)
-    except Exception as exc:
-        print(f"Pydantic validation error: {exc}")
-        return {"status": "ERROR", "message": str(exc)}
-    
-    # Run workflow with feedback loop
+    return _run_feedback_engine(workflow_config)
+
+
+def _run_feedback_engine(config: WorkflowConfig) -> Dict[str, Any]:
+    """Run a validated workflow on a fresh feedback loop engine."""
     # Generate state file name based on workflow name
     state_file = f"workflow_{config.project.name}_state.json"
     engine = FeedbackLoopWorkflowEngine(state_file=state_file)
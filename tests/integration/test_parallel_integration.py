@@ -5,13 +5,16 @@ Integration tests for parallel processing functionality.
 import unittest
 import tempfile
 import json
-import time
 from pathlib import Path
 
+import pytest
+
 from orchestrator.parallel.orchestrator import ParallelOrchestrator
 from orchestrator.agents.registry import AgentRegistry
 from orchestrator.parallel.task_queue import TaskPriority
 
+pytestmark = pytest.mark.integration
+
 
 class TestParallelIntegration(unittest.TestCase):
     """Integration tests for parallel processing."""
@@ -73,16 +76,15 @@ class TestParallelIntegration(unittest.TestCase):
 
     def test_system_monitoring(self):
         """Test system monitoring functionality."""
-        # Wait for monitor to collect metrics
-        time.sleep(1.0)
+        # Wait for the monitor's first sample instead of a fixed sleep
+        self.assertTrue(self.orchestrator.resource_monitor.wait_for_sample(timeout=5.0))
         
         # Get system metrics
         metrics = self.orchestrator.get_system_metrics()
         
         # Should return some metrics
         self.assertIsInstance(metrics, dict)
-        self.assertIn('cpu_usage', metrics)
-        self.assertIn('memory_usage', metrics)
+        self.assertLessEqual({'cpu_usage', 'memory_usage'}, metrics.keys())
         self.assertGreaterEqual(metrics['cpu_usage'], 0)  # CPU usage should be non-negative
         self.assertGreater(metrics['memory_usage'], 0)  # Memory usage should be positive
 
@@ -98,9 +100,7 @@ class TestParallelIntegration(unittest.TestCase):
         # Check that we have the expected pool
         self.assertIn('pool_0', status)
         pool_status = status['pool_0']
-        self.assertIn('active_tasks', pool_status)
-        self.assertIn('max_workers', pool_status)
-        self.assertIn('utilization', pool_status)
+        self.assertLessEqual({'active_tasks', 'max_workers', 'utilization'}, pool_status.keys())
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@
 import pytest
 from orchestrator.main import main
 
+pytestmark = pytest.mark.integration
+
 
 def test_end_to_end_workflow_execution():
     """Test end-to-end workflow execution."""
@@ -0,0 +1,50 @@
+"""Unit tests for the agent loader."""
+
+import pytest
+
+from orchestrator.agents.base import Agent
+from orchestrator.agents.loader import AgentLoader
+from orchestrator.agents.registry import AgentRegistry
+
+
+class EchoAgent(Agent):
+    """Minimal agent that returns its context."""
+
+    def run(self, context):
+        return context
+
+
+@pytest.fixture
+def agent_loader():
+    """Loader backed by a private registry holding a single agent."""
+    agent_registry = AgentRegistry()
+    agent_registry.register("echo", EchoAgent)
+    loader = AgentLoader()
+    loader._registry = agent_registry
+    return loader
+
+
+def test_load_agent_reuses_instance(agent_loader):
+    """A second load of the same agent id returns the cached instance."""
+    agent = agent_loader.load_agent("echo")
+    assert isinstance(agent, EchoAgent)
+    assert agent.id == "echo"
+    assert agent_loader.load_agent("echo") is agent
+
+
+def test_unknown_agent_raises_and_is_not_cached(agent_loader):
+    """Unknown agent ids raise KeyError every time and leave the cache untouched."""
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            agent_loader.load_agent("missing")
+    assert "missing" not in agent_loader._cache
+
+    agent_loader._registry.register("missing", EchoAgent)
+    assert isinstance(agent_loader.load_agent("missing"), EchoAgent)
+
+
+def test_clear_cache_forces_new_instance(agent_loader):
+    """Clearing the cache makes the next load create a fresh instance."""
+    agent = agent_loader.load_agent("echo")
+    agent_loader.clear_cache()
+    assert agent_loader.load_agent("echo") is not agent
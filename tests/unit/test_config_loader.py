@@ -3,7 +3,8 @@
 import pytest
 import unittest
 from pathlib import Path
-from orchestrator.config.loader import ConfigLoader
+from orchestrator.config import loader as config_loader
+from orchestrator.config.loader import ConfigLoader, load_validated_workflow
 from orchestrator.config.models import WorkflowConfig
 
 
@@ -12,7 +13,7 @@ def test_load_workflow():
     loader = ConfigLoader()
     
     # Test loading a valid workflow file
-    workflow_config = loader.load_workflow("/workspace/tests/test_workflow.yaml")
+    workflow_config = loader.load_workflow(Path(__file__).parents[1] / "test_workflow.yaml")
     
     # Verify it returns a WorkflowConfig instance
     assert isinstance(workflow_config, WorkflowConfig)
@@ -62,3 +63,28 @@ def test_list_templates():
     
     # Verify all templates are strings
     assert all(isinstance(template, str) for template in templates)
+
+
+def test_load_yaml_first_stops_at_first_document(tmp_path):
+    """Only the first non-empty document is parsed."""
+    path = tmp_path / "multi.yaml"
+    # The second document is malformed; it must never be parsed
+    path.write_text("---\nname: first\n---\nname: [unterminated\n", encoding="utf-8")
+
+    assert ConfigLoader()._load_yaml_first(path) == {"name": "first"}
+
+
+def test_load_validated_workflow_is_cached_and_bounded(tmp_path):
+    """Valid and invalid workflows are both cached, in a bounded cache."""
+    valid_path = tmp_path / "workflow.yaml"
+    valid_path.write_bytes((Path(__file__).parents[2] / "examples" / "simple-web-app" / "workflow.yaml").read_bytes())
+    invalid_path = tmp_path / "invalid.yaml"
+    invalid_path.write_text("version: '1.0'\n", encoding="utf-8")
+
+    config, errors = load_validated_workflow(valid_path)
+    assert isinstance(config, WorkflowConfig) and errors == ()
+    assert load_validated_workflow(str(valid_path))[0] is config
+
+    config, errors = load_validated_workflow(invalid_path)
+    assert config is None and errors
+    assert config_loader._load_validated_workflow.cache_info().maxsize == 32
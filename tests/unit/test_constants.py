@@ -0,0 +1,17 @@
+"""Unit tests for orchestrator constants helpers."""
+
+import pytest
+
+from orchestrator.utils.constants import ExecutionMode, ProjectType, to_enum
+
+
+def test_to_enum_lookup():
+    """Test coercing raw values to enum members."""
+    assert to_enum(ProjectType, "web") is ProjectType.WEB
+    assert to_enum(ExecutionMode, ExecutionMode.PARALLEL) is ExecutionMode.PARALLEL
+
+
+def test_to_enum_invalid_value():
+    """Test that unknown values raise ValueError like Enum.__call__."""
+    with pytest.raises(ValueError):
+        to_enum(ProjectType, "unknown")
@@ -1,7 +1,16 @@
 """Unit tests for Orchestrator core logic."""
 
+import asyncio
+import os
+import shutil
+from concurrent.futures import Future
+from pathlib import Path
+
 import pytest
-from orchestrator.main import main
+import yaml
+from orchestrator import main as orchestrator_main
+from orchestrator.config.models import WorkflowConfig
+from orchestrator.main import _load_and_validate, main
 
 
 def test_orchestrator_initialization():
@@ -20,3 +29,78 @@ def test_agent_coordination():
     """Test agent coordination."""
     # Add test logic here
     assert True
+
+
+def test_load_and_validate_caches_until_file_changes(tmp_path):
+    """Repeat loads of an unchanged workflow reuse the validated config."""
+    workflow_path = tmp_path / "workflow.yaml"
+    shutil.copy(Path(__file__).parents[2] / "examples" / "simple-web-app" / "workflow.yaml", workflow_path)
+
+    first = _load_and_validate(workflow_path)
+    assert _load_and_validate(workflow_path) is first
+
+    st = workflow_path.stat()
+    os.utime(workflow_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert _load_and_validate(workflow_path) is not first
+
+
+def test_parallel_workflow_can_be_cancelled(monkeypatch):
+    """Cancelling the parallel run stops waiting and still shuts the orchestrator down."""
+    futures = {}
+    shutdowns = []
+
+    class PendingOrchestrator:
+        def __init__(self, **kwargs):
+            self.futures = futures
+
+        def submit_batch(self, tasks):
+            for task in tasks:
+                self.futures[f"task-{len(self.futures)}"] = Future()
+            return list(self.futures)
+
+        def get_task_future(self, task_id):
+            return self.futures[task_id]
+
+        def shutdown(self):
+            shutdowns.append(self)
+
+    monkeypatch.setattr(orchestrator_main, "ParallelOrchestrator", PendingOrchestrator)
+    config = _load_and_validate(Path(__file__).parents[2] / "examples" / "simple-web-app" / "workflow.yaml")
+
+    async def scenario():
+        run = asyncio.create_task(orchestrator_main._run_parallel_workflow_async(config))
+        await asyncio.sleep(0.01)
+        run.cancel()
+        await asyncio.wait({run}, timeout=1.0)
+        cancelled = run.cancelled()
+        # Let a run that swallowed the cancellation finish
+        for future in futures.values():
+            if not future.done():
+                future.set_result(None)
+        await asyncio.wait({run})
+        return cancelled
+
+    assert asyncio.run(scenario())
+    assert len(shutdowns) == 1
+
+
+def test_load_and_validate_propagates_file_and_yaml_errors(tmp_path):
+    """Missing files and malformed YAML are not reported as model validation errors."""
+    with pytest.raises(FileNotFoundError):
+        _load_and_validate(tmp_path / "missing.yaml")
+
+    malformed = tmp_path / "malformed.yaml"
+    malformed.write_text("version: [unterminated\n", encoding="utf-8")
+    with pytest.raises(yaml.YAMLError):
+        _load_and_validate(malformed)
+
+
+def test_load_and_validate_exits_on_model_errors(monkeypatch, capsys):
+    """Model validation failures are reported and end the process."""
+    def invalid(path):
+        return WorkflowConfig.model_validate({}), ()
+
+    monkeypatch.setattr(orchestrator_main, "load_validated_workflow", invalid)
+    with pytest.raises(SystemExit):
+        _load_and_validate(Path("workflow.yaml"))
+    assert "Pydantic validation error" in capsys.readouterr().out
@@ -2,6 +2,7 @@
 Unit tests for parallel processing functionality.
 """
 
+import threading
 import unittest
 import time
 from unittest.mock import Mock, patch
@@ -9,7 +10,7 @@ from unittest.mock import Mock, patch
 from orchestrator.parallel.task_queue import TaskQueue, Task, TaskPriority, TaskStatus
 from orchestrator.parallel.worker_pool import WorkerPool
 from orchestrator.parallel.load_balancer import LoadBalancer
-from orchestrator.parallel.monitor import ResourceMonitor
+from orchestrator.parallel.monitor import ResourceMonitor, SystemMetrics
 
 
 class TestTaskQueue(unittest.TestCase):
@@ -53,6 +54,13 @@ class TestTaskQueue(unittest.TestCase):
         self.assertEqual(second_task.task_id, medium_id)
         self.assertEqual(third_task.task_id, low_id)
 
+    def test_equal_priority_is_fifo(self):
+        """Test that tasks of equal priority are processed in submission order."""
+        task_ids = [self.queue.add_task("test_agent", {"n": n}) for n in range(5)]
+
+        order = [self.queue.get_next_task().task_id for _ in task_ids]
+        self.assertEqual(order, task_ids)
+
     def test_task_completion(self):
         """Test task completion functionality."""
         task_id = self.queue.add_task("test_agent", {})
@@ -69,6 +77,86 @@ class TestTaskQueue(unittest.TestCase):
         result = self.queue.get_task_result(task_id)
         self.assertEqual(result, {"success": True})
 
+    def test_get_task_results(self):
+        """Test batched result lookup only returns completed tasks."""
+        done_id = self.queue.add_task("test_agent", {})
+        pending_id = self.queue.add_task("test_agent", {})
+        self.queue.complete_task(done_id, result={"success": True})
+        
+        results = self.queue.get_task_results([done_id, pending_id, "missing"])
+        
+        self.assertEqual(results, {done_id: {"success": True}})
+
+    def test_wait_all(self):
+        """Test waiting for a set of tasks to finish."""
+        ok_id = self.queue.add_task("test_agent", {})
+        failed_id = self.queue.add_task("test_agent", {})
+        self.assertFalse(self.queue.wait_all([ok_id, failed_id], timeout=0.05))
+        
+        self.queue.complete_task(ok_id)
+        self.queue.fail_task(failed_id, "boom")
+        
+        self.assertTrue(self.queue.wait_all([ok_id, failed_id], timeout=0.05))
+
+    def test_completions(self):
+        """Test that completions yields tasks in the order they finish."""
+        first_id = self.queue.add_task("test_agent", {})
+        second_id = self.queue.add_task("test_agent", {})
+        self.queue.fail_task(second_id, "boom")
+        timer = threading.Timer(0.05, self.queue.complete_task, args=(first_id, "first"))
+        timer.start()
+
+        finished = list(self.queue.completions([first_id, second_id, "missing"], timeout=1.0))
+        timer.join()
+        self.assertEqual([task.task_id for task in finished], [second_id, first_id])
+
+        pending_id = self.queue.add_task("test_agent", {})
+        self.assertEqual(list(self.queue.completions([pending_id], timeout=0.05)), [])
+
+    def test_task_future(self):
+        """Test that task futures resolve on completion and failure."""
+        ok_id = self.queue.add_task("test_agent", {})
+        failed_id = self.queue.add_task("test_agent", {})
+        ok_future = self.queue.get_task_future(ok_id)
+        failed_future = self.queue.get_task_future(failed_id)
+        self.assertFalse(ok_future.done())
+        
+        self.queue.complete_task(ok_id, result={"success": True})
+        self.queue.fail_task(failed_id, "boom")
+        
+        self.assertEqual(ok_future.result(timeout=0), {"success": True})
+        with self.assertRaises(RuntimeError):
+            failed_future.result(timeout=0)
+
+    def test_add_tasks_bulk(self):
+        """Test that bulk-added tasks are queued in priority order."""
+        task_ids = self.queue.add_tasks_bulk([
+            ("test_agent", {"n": 1}, TaskPriority.LOW, None, None),
+            ("test_agent", {"n": 2}, TaskPriority.CRITICAL, None, None),
+            ("test_agent", {"n": 3}, TaskPriority.MEDIUM, 5.0, None),
+        ])
+        self.assertEqual(len(task_ids), 3)
+
+        order = [self.queue.get_next_task(timeout=0.1).task_id for _ in task_ids]
+        self.assertEqual(order, [task_ids[1], task_ids[2], task_ids[0]])
+
+    def test_task_dependencies(self):
+        """Test that dependent tasks are only handed out once their dependencies finish."""
+        first_id = self.queue.add_task("test_agent", {})
+        second_id = self.queue.add_task("test_agent", {})
+        dependent_id = self.queue.add_task("test_agent", {}, priority=TaskPriority.CRITICAL,
+                                           dependencies=[first_id, second_id])
+
+        self.assertEqual(self.queue.get_next_task(timeout=0.1).task_id, first_id)
+        self.assertEqual(self.queue.get_next_task(timeout=0.1).task_id, second_id)
+        self.assertIsNone(self.queue.get_next_task(timeout=0.1))
+
+        self.queue.complete_task(first_id)
+        self.assertIsNone(self.queue.get_next_task(timeout=0.1))
+
+        self.queue.cancel_task(second_id)
+        self.assertEqual(self.queue.get_next_task(timeout=0.1).task_id, dependent_id)
+
 
 class TestWorkerPool(unittest.TestCase):
     """Test the worker pool functionality."""
@@ -132,6 +220,45 @@ class TestResourceMonitor(unittest.TestCase):
         self.monitor.stop()
         self.assertFalse(self.monitor.running)
 
+    def test_monitor_stop_does_not_wait_out_interval(self):
+        """Test that stop() returns promptly even with a long monitoring interval."""
+        monitor = ResourceMonitor(monitoring_interval=30.0)
+        monitor.start()
+
+        start = time.time()
+        monitor.stop()
+        self.assertLess(time.time() - start, 1.0)
+
+    def test_sample_once(self):
+        """Test that a sample can be taken synchronously without the monitor thread."""
+        if self.monitor._disabled:
+            self.skipTest("psutil is not available")
+        seen = []
+        self.monitor.register_callback(seen.append)
+
+        metrics = self.monitor.sample_once()
+        self.assertIsNone(self.monitor.monitor_thread)
+        self.assertEqual(self.monitor.get_system_metrics_history(), [metrics])
+        self.assertEqual(seen, [metrics])
+        self.assertTrue(self.monitor.wait_for_sample(timeout=0))
+
+    def test_wait_for_sample(self):
+        """Test that waiting for a sample returns as soon as one is recorded."""
+        self.assertFalse(self.monitor.wait_for_sample(timeout=0.01))
+
+        threading.Timer(0.05, self.monitor._record_system_metrics, args=(SystemMetrics.capture(),)).start()
+        self.assertTrue(self.monitor.wait_for_sample(timeout=1.0))
+
+    def test_monitor_disabled_without_psutil(self):
+        """Test that no monitor thread is started when psutil is unavailable."""
+        with patch("orchestrator.parallel.monitor.psutil", None):
+            monitor = ResourceMonitor(monitoring_interval=0.1)
+            monitor.start()
+            self.assertIsNone(monitor.monitor_thread)
+            self.assertFalse(monitor.wait_for_sample(timeout=1.0))
+            self.assertEqual(monitor.get_current_system_metrics().cpu_usage, 0.0)
+            monitor.stop()
+
     def test_task_metrics_recording(self):
         """Test task metrics recording."""
         # Create a mock task
@@ -153,6 +280,26 @@ class TestResourceMonitor(unittest.TestCase):
         self.assertEqual(metrics[0].task_id, "test_task")
         self.assertAlmostEqual(metrics[0].execution_time, 1.0, delta=0.1)
 
+    def test_average_usage_tracks_bounded_history(self):
+        """Test that averages only cover the samples still in the history."""
+        for i in range(8):
+            self.monitor._record_system_metrics(
+                SystemMetrics(timestamp=i, cpu_usage=float(i), memory_usage=i * 10.0,
+                              memory_total=100.0, disk_usage=0.0)
+            )
+
+        # history_size is 5, so samples 3..7 remain
+        self.assertAlmostEqual(self.monitor.get_average_cpu_usage(), 5.0)
+        self.assertAlmostEqual(self.monitor.get_average_memory_usage(), 50.0)
+
+    def test_callbacks_run_outside_lock(self):
+        """Test that callbacks may call back into the monitor."""
+        seen = []
+        self.monitor.register_callback(lambda metrics: seen.append(self.monitor.get_task_metrics_history()))
+
+        self.monitor._notify_callbacks(SystemMetrics.capture())
+        self.assertEqual(seen, [[]])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,427 @@
+"""Unit tests for the feedback loop workflow engine."""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+import orchestrator.agents  # noqa: F401 - registers the built-in agents
+from orchestrator.config.models import WorkflowConfig
+from orchestrator import workflow_engine
+from orchestrator.notification.notifier import NotificationType
+from orchestrator.workflow_engine import (
+    MAX_HISTORY_ENTRIES,
+    FeedbackCategory,
+    FeedbackLoopWorkflowEngine,
+    FeedbackSeverity,
+    HistoryEntry,
+    TaskState,
+    TaskStateEncoder,
+    TaskStatus,
+    run_workflow_with_feedback,
+)
+
+
+@pytest.fixture
+def workflow_config():
+    """Minimal single-stage workflow configuration."""
+    return WorkflowConfig(**{
+        "version": "1.0",
+        "project": {"name": "Test Project", "type": "custom"},
+        "agents": {"include_templates": ["core"]},
+        "workflow": {"stages": [{"name": "planning", "agents": ["planner"]}]},
+    })
+
+
+def test_task_state_history_is_bounded():
+    """Test that feedback history is capped and transitions are still counted."""
+    task_state = TaskState("task-1", "planner", {})
+    for i in range(MAX_HISTORY_ENTRIES + 10):
+        task_state.add_feedback({"feedback_id": str(i)})
+    task_state.change_status(TaskStatus.IN_PROGRESS)
+    
+    data = task_state.to_dict()
+    assert len(data["feedback_history"]) == MAX_HISTORY_ENTRIES
+    assert data["feedback_history"][-1] == {"feedback_id": str(MAX_HISTORY_ENTRIES + 9)}
+    assert data["status_transitions_total"] == 1
+
+
+def test_task_state_to_dict_is_json_serializable():
+    """Test that to_dict() emits plain values that the stdlib json module accepts."""
+    task_state = TaskState("task-1", "planner", {})
+    task_state.change_status(TaskStatus.IN_PROGRESS, "Started", now=1.0)
+    task_state.add_feedback({
+        "status": TaskStatus.NEEDS_FIXES,
+        "severity": FeedbackSeverity.HIGH,
+        "category": FeedbackCategory.TEST,
+    })
+    
+    data = json.loads(json.dumps(task_state.to_dict()))
+    assert data["status"] == "IN_PROGRESS"
+    assert data["status_history"] == [
+        {"from": "NEW", "to": "IN_PROGRESS", "timestamp": 1.0, "reason": "Started"}
+    ]
+    assert HistoryEntry.from_dict(data["status_history"][0]) == task_state.status_history[0]
+    assert data["feedback_history"] == [{"status": "NEEDS_FIXES", "severity": "high", "category": "test"}]
+
+
+def test_engine_debug_logging_is_off_by_default():
+    """Test that per-task DEBUG logs are disabled at the default LOGGING_LEVEL."""
+    assert workflow_engine.LOGGING_LEVEL == "INFO"
+    assert not workflow_engine._logger.isEnabledFor(logging.DEBUG)
+    assert workflow_engine._logger.isEnabledFor(logging.INFO)
+
+
+def test_run_workflow_returns_response(workflow_config):
+    """Test that run_workflow drives all submitted tasks and returns a response."""
+    engine = FeedbackLoopWorkflowEngine()
+    response = engine.run_workflow(workflow_config)
+    
+    assert response["status"] == "OK"
+    assert response["context"]["total_tasks"] == 1
+    assert all(ts.status != TaskStatus.NEW for ts in engine.task_states.values())
+    
+    assert "task_states" not in response["context"]
+    assert response["context"]["task_ids"] == list(engine.task_states)
+    assert sum(engine.status_counts().values()) == len(engine.task_states)
+    assert response["context"]["status_counts"] == engine.status_counts()
+    for name, count in response["context"]["notifications"]["notification_types"].items():
+        assert count == engine.notification_manager.get_unread_count(NotificationType(name))
+    
+    # Response must be JSON-serializable with the task state encoder
+    assert json.loads(json.dumps(response, cls=TaskStateEncoder))["status"] == "OK"
+
+
+def test_run_workflow_includes_task_states_on_request(workflow_config):
+    """Test that full task states are only dumped when requested."""
+    engine = FeedbackLoopWorkflowEngine(include_task_states_in_response=True)
+    response = engine.run_workflow(workflow_config)
+    
+    task_states = json.loads(json.dumps(response, cls=TaskStateEncoder))["context"]["task_states"]
+    assert set(task_states) == set(engine.task_states)
+    for task_id, dumped in task_states.items():
+        assert dumped["agent_type"] == engine.get_task_state(task_id).agent_type
+
+
+def test_run_workflow_points_to_state_file(workflow_config, tmp_path):
+    """Test that responses reference the saved state instead of embedding it."""
+    state_file = tmp_path / "state.json"
+    engine = FeedbackLoopWorkflowEngine(state_file=str(state_file))
+    response = engine.run_workflow(workflow_config)
+    
+    assert "task_states" not in response["context"]
+    assert response["context"]["state_file"] == str(state_file)
+    saved = json.loads(state_file.read_text(encoding="utf-8"))["task_states"]
+    assert set(saved) == set(response["context"]["task_ids"])
+
+
+def test_approved_review_completes_in_one_transition():
+    """Test that approving a task in review moves it straight to DONE."""
+    engine = FeedbackLoopWorkflowEngine()
+    try:
+        task_id = engine.submit_task("planner", {})
+        engine.change_task_status(task_id, TaskStatus.IN_REVIEW, "Ready for review")
+        engine.parallel_orchestrator.get_task_result = lambda run_id: {"status": "OK"}
+        engine._generate_feedback = lambda tid, result: {
+            "status": TaskStatus.APPROVED,
+            "recommendation": "Looks good",
+        }
+        
+        assert engine.process_feedback_loop(task_id) is True
+        
+        task_state = engine.get_task_state(task_id)
+        assert task_state.status == TaskStatus.DONE
+        assert task_state.status_history[-1].from_status is TaskStatus.IN_REVIEW
+        assert engine.notification_manager.get_unread_count(NotificationType.APPROVAL_COMPLETED) == 1
+    finally:
+        engine.parallel_orchestrator.shutdown()
+
+
+def test_blocked_task_does_not_hang(workflow_config):
+    """Test that a task whose dependency never completes is left blocked."""
+    engine = FeedbackLoopWorkflowEngine()
+    # No agent is registered under this type, so the dependency's run fails
+    dependency_id = engine.submit_task("unregistered_agent", {})
+    blocked_id = engine.submit_task("tester", {"dependencies": [dependency_id]})
+    
+    response = engine.run_workflow(workflow_config)
+    
+    assert response["context"]["total_tasks"] == 3
+    assert engine.task_states[dependency_id].status is TaskStatus.IN_PROGRESS
+    assert engine.task_states[blocked_id].status is TaskStatus.NEW
+    assert engine.task_states[blocked_id].blocked_by == {dependency_id}
+
+
+def test_cancelled_parked_driver_releases_its_slot_once():
+    """Test that cancelling a driver parked on dependencies keeps the driver count exact."""
+    engine = FeedbackLoopWorkflowEngine()
+    try:
+        dependency_id = engine.submit_task("planner", {})
+        blocked_id = engine.submit_task("tester", {"dependencies": [dependency_id]})
+        engine.parallel_orchestrator.get_task_future(blocked_id).result(timeout=5)
+        
+        async def scenario():
+            engine._drivers_changed = asyncio.Condition()
+            # The dependency's driver stays active, so the blocked driver parks
+            engine._active_drivers = 2
+            driver = asyncio.create_task(engine._drive_task(blocked_id))
+            while engine._active_drivers != 1:
+                await asyncio.sleep(0)
+            driver.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await driver
+            return engine._active_drivers
+        
+        assert asyncio.run(scenario()) == 1
+    finally:
+        engine.parallel_orchestrator.shutdown()
+
+
+def test_done_task_unblocks_dependents():
+    """Test that a dependent becomes startable once its last dependency is DONE."""
+    engine = FeedbackLoopWorkflowEngine()
+    try:
+        first_id = engine.submit_task("planner", {})
+        second_id = engine.submit_task("planner", {})
+        dependent_id = engine.submit_task("tester", {"dependencies": [first_id, second_id]})
+        dependent = engine.get_task_state(dependent_id)
+        assert dependent.blocked_by == {first_id, second_id}
+        assert dependent.to_dict()["dependencies"] == sorted([first_id, second_id])
+        
+        for task_id in (first_id, second_id):
+            engine.change_task_status(task_id, TaskStatus.IN_REVIEW)
+            engine.change_task_status(task_id, TaskStatus.DONE)
+        
+        assert not dependent.blocked_by
+        assert dependent.can_start()
+    finally:
+        engine.parallel_orchestrator.shutdown()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_state_file_round_trip(tmp_path, monkeypatch, use_orjson):
+    """Test that saved state is written atomically and reloads."""
+    if not use_orjson:
+        monkeypatch.setattr(workflow_engine, "orjson", None)
+    elif workflow_engine.orjson is None:
+        pytest.skip("orjson is not installed")
+    state_file = tmp_path / "state.json"
+    engine = FeedbackLoopWorkflowEngine(state_file=str(state_file))
+    try:
+        task_id = engine.submit_task("planner", {"ports": {8080: "web"}})
+        engine.save_state()
+    finally:
+        engine.parallel_orchestrator.shutdown()
+    
+    assert not (tmp_path / "state.json.tmp").exists()
+    reloaded = FeedbackLoopWorkflowEngine(state_file=str(state_file))
+    reloaded.parallel_orchestrator.shutdown()
+    restored = reloaded.get_task_state(task_id)
+    assert restored.status == TaskStatus.IN_PROGRESS
+    assert restored.status_history[-1].from_status is TaskStatus.NEW
+    assert restored.status_history[-1].to_status is TaskStatus.IN_PROGRESS
+    # Both serializers write non-str keys as strings
+    assert restored.payload == {"ports": {"8080": "web"}}
+
+
+def test_corrupt_state_file_is_quarantined(tmp_path):
+    """Test that an unreadable state file is set aside instead of reused."""
+    state_file = tmp_path / "state.json"
+    state_file.write_text("{not json", encoding="utf-8")
+    
+    engine = FeedbackLoopWorkflowEngine(state_file=str(state_file))
+    engine.parallel_orchestrator.shutdown()
+    
+    assert engine.task_states == {}
+    assert not state_file.exists()
+    assert (tmp_path / "state.json.corrupt").read_text(encoding="utf-8") == "{not json"
+
+
+def test_save_state_only_reserializes_changed_tasks(tmp_path, monkeypatch):
+    """Test that unchanged tasks reuse their cached serialization between saves."""
+    state_file = tmp_path / "state.json"
+    engine = FeedbackLoopWorkflowEngine(state_file=str(state_file))
+    try:
+        unchanged_id = engine.submit_task("planner", {})
+        changed_id = engine.submit_task("planner", {})
+        engine.save_state()
+        
+        serialized = []
+        to_dict = TaskState.to_dict
+        monkeypatch.setattr(TaskState, "to_dict", lambda self: serialized.append(self.task_id) or to_dict(self))
+        engine.change_task_status(changed_id, TaskStatus.IN_REVIEW, "Ready for review")
+        engine.save_state()
+    finally:
+        engine.parallel_orchestrator.shutdown()
+    
+    assert serialized == [changed_id]
+    saved = json.loads(state_file.read_text(encoding="utf-8"))["task_states"]
+    assert saved[changed_id]["status"] == TaskStatus.IN_REVIEW.value
+    assert saved[unchanged_id]["status"] == TaskStatus.IN_PROGRESS.value
+
+
+def test_save_state_tracks_cleared_blocked_by_and_removed_tasks(tmp_path):
+    """Test that clearing blocked_by reaches the state file and dropped tasks leave the cache."""
+    state_file = tmp_path / "state.json"
+    engine = FeedbackLoopWorkflowEngine(state_file=str(state_file))
+    try:
+        dependency_id = engine.submit_task("planner", {})
+        dependent_id = engine.submit_task("tester", {"dependencies": [dependency_id]})
+        engine.save_state()
+        
+        del engine.task_states[dependency_id]
+        engine.task_states[dependent_id].clear_blocked_by()
+        engine.save_state()
+    finally:
+        engine.parallel_orchestrator.shutdown()
+    
+    saved = json.loads(state_file.read_text(encoding="utf-8"))["task_states"]
+    assert list(saved) == [dependent_id]
+    assert saved[dependent_id]["blocked_by"] == []
+    assert set(engine._state_fragments) == {dependent_id}
+
+
+def test_max_retries_rejects_in_one_batched_transition():
+    """Test that NEEDS_FIXES -> IN_REVIEW -> REJECTED is applied as one change."""
+    engine = FeedbackLoopWorkflowEngine()
+    try:
+        task_id = engine.submit_task("planner", {})
+        task_state = engine.get_task_state(task_id)
+        task_state.retry_count = task_state.max_retries
+        engine.notification_manager.mark_all_as_read()
+        engine.parallel_orchestrator.get_task_result = lambda run_id: {"status": "OK"}
+        engine._generate_feedback = lambda tid, result: {
+            "status": TaskStatus.NEEDS_FIXES,
+            "recommendation": "Still broken",
+        }
+        
+        assert engine.process_feedback_loop(task_id) is False
+        
+        assert task_state.status == TaskStatus.REJECTED
+        last_two = list(task_state.status_history)[-2:]
+        assert [(entry.from_status, entry.to_status) for entry in last_two] == [
+            (TaskStatus.NEEDS_FIXES, TaskStatus.IN_REVIEW),
+            (TaskStatus.IN_REVIEW, TaskStatus.REJECTED),
+        ]
+        assert last_two[0].timestamp == last_two[1].timestamp
+        assert engine.status_counts() == {TaskStatus.REJECTED.value: 1}
+        # IN_PROGRESS -> NEEDS_FIXES, then one notification for the batched path
+        assert engine.notification_manager.get_unread_count(NotificationType.STATUS_CHANGE) == 2
+    finally:
+        engine.parallel_orchestrator.shutdown()
+
+
+def test_batch_transition_validates_whole_path():
+    """Test that an invalid step leaves the task untouched."""
+    task_state = TaskState("task-1", "planner", {})
+    with pytest.raises(ValueError):
+        task_state.change_status_path([TaskStatus.IN_PROGRESS, TaskStatus.DONE])
+    assert task_state.status == TaskStatus.NEW
+    assert not task_state.status_history
+
+
+def test_batch_transition_rejects_empty_path_and_terminal_start():
+    """Test that a status path needs at least one step and cannot leave DONE."""
+    task_state = TaskState("task-1", "planner", {})
+    with pytest.raises(ValueError, match="must not be empty"):
+        task_state.change_status_path([])
+    
+    task_state.change_status_path([TaskStatus.IN_PROGRESS, TaskStatus.IN_REVIEW, TaskStatus.DONE])
+    with pytest.raises(ValueError, match="terminal state"):
+        task_state.change_status_path([TaskStatus.IN_PROGRESS])
+    assert task_state.status == TaskStatus.DONE
+
+
+def test_max_parallel_tasks_caps_worker_pool():
+    """Test that the engine's concurrency limit sizes the orchestrator's workers."""
+    engine = FeedbackLoopWorkflowEngine(max_parallel_tasks=2)
+    engine.parallel_orchestrator.shutdown()
+    assert [pool.max_workers for pool in engine.parallel_orchestrator.worker_pools] == [2]
+
+
+def test_transition_shares_one_timestamp():
+    """Test that a transition stamps history, state and notifications alike."""
+    engine = FeedbackLoopWorkflowEngine()
+    try:
+        task_id = engine.submit_task("planner", {})
+        engine.change_task_status(task_id, TaskStatus.IN_REVIEW, "Ready for review", now=1234.5)
+    finally:
+        engine.parallel_orchestrator.shutdown()
+    
+    task_state = engine.get_task_state(task_id)
+    assert task_state.status_history[-1].timestamp == 1234.5
+    assert task_state.updated_at == 1234.5
+    request = engine.notification_manager.get_notifications(NotificationType.FEEDBACK_REQUEST)[-1]
+    assert request.context["feedback_details"]["timestamp"] == 1234.5
+
+
+def test_async_feedback_audits_off_the_event_loop():
+    """Test that the quality audit runs in a worker thread, not on the loop."""
+    audit_threads = []
+    
+    class RecordingAuditor:
+        def run(self, context):
+            audit_threads.append(threading.get_ident())
+            return {"findings": [], "recommendation": "Looks good"}
+    
+    engine = FeedbackLoopWorkflowEngine()
+    try:
+        task_id = engine.submit_task("planner", {})
+        engine._quality_auditor = RecordingAuditor()
+        engine.parallel_orchestrator.get_task_result = lambda run_id: {"status": "OK"}
+        
+        assert asyncio.run(engine.process_feedback_loop_async(task_id)) is False
+    finally:
+        engine.parallel_orchestrator.shutdown()
+    
+    assert audit_threads and audit_threads[0] != threading.get_ident()
+    assert engine.get_task_state(task_id).status == TaskStatus.IN_REVIEW
+
+
+def test_done_is_terminal():
+    """Test that a finished task rejects any further transition."""
+    task_state = TaskState("task-1", "planner", {})
+    task_state.change_status_path([TaskStatus.IN_PROGRESS, TaskStatus.IN_REVIEW, TaskStatus.DONE])
+    with pytest.raises(ValueError, match="terminal"):
+        task_state.change_status(TaskStatus.IN_PROGRESS)
+
+
+def test_run_workflow_with_feedback_caches_config(tmp_path, monkeypatch):
+    """Test that repeat runs of an unchanged workflow file reuse the validated config."""
+    workflow_path = tmp_path / "workflow.yaml"
+    shutil.copy(Path(__file__).parents[2] / "examples" / "simple-web-app" / "workflow.yaml", workflow_path)
+    monkeypatch.setattr(workflow_engine, "_run_feedback_engine", lambda config: config)
+    
+    first = run_workflow_with_feedback(workflow_path)
+    assert isinstance(first, WorkflowConfig)
+    assert run_workflow_with_feedback(str(workflow_path)) is first
+
+
+def test_fast_ids_look_like_uuid_hex():
+    """Test that feedback and trace ids keep the 32-hex-digit uuid4().hex shape."""
+    ids = {workflow_engine._fast_id() for _ in range(100)}
+    assert len(ids) == 100
+    assert all(len(i) == 32 and int(i, 16) >= 0 for i in ids)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_children_generate_different_ids():
+    """Test that a forked child does not replay the parent's id sequence."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, workflow_engine._fast_id().encode())
+        os._exit(0)
+    
+    os.close(write_fd)
+    parent_id = workflow_engine._fast_id()
+    with os.fdopen(read_fd, "rb") as pipe:
+        child_id = pipe.read().decode()
+    os.waitpid(pid, 0)
+    assert child_id != parent_id